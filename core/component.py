@@ -1,45 +1,223 @@
 """
 Component module for managing TSX components
 """
+import io
 import os
 import re
+import sys
 import logging
+import mmap
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
-from typing import List, Optional, Dict, Set
+from functools import lru_cache
+from itertools import islice
+from typing import List, Optional, Dict, Set, FrozenSet, Tuple, Pattern, Match, Callable, Iterator
+
+from utils.file_utils import write_atomic
 
 logger = logging.getLogger(__name__)
 
-@dataclass
+# Matches `import X from 'pkg'`, `import { X } from 'pkg'` and `import * as X from 'pkg'`
+_IMPORT_RE = re.compile(
+    r"import\s+(?:\{[^}]*\}|\*\s+as\s+[a-zA-Z_]\w*|[a-zA-Z_]\w*)\s+from\s+['\"]([^'\"]+)['\"]"
+)
+
+# Icon names that indicate a component relies on lucide-react
+_LUCIDE_ICON_RE = re.compile(r'\b(?:Server|Database|Globe|Users|Network|Shield|Activity)\b')
+
+# Files larger than this are memory-mapped instead of read in one call
+_MMAP_THRESHOLD = 1 << 20
+
+# Dependency scans stop after this many consecutive non-import lines
+_MAX_NON_IMPORT_LINES = 8
+
+# Upper bound on threads used by ComponentManager.get_all_dependencies
+_MAX_SCAN_WORKERS = 8
+
+# Indent strings used by Component.prettify, grown on demand
+_INDENT_CACHE = ['']
+
+def _indent(level: int) -> str:
+    """Return the cached indent string for the given nesting level"""
+    while len(_INDENT_CACHE) <= level:
+        _INDENT_CACHE.append(_INDENT_CACHE[-1] + '  ')
+    return _INDENT_CACHE[level]
+
+# Literal declarator prefixes; they contain no metacharacters so are never escaped
+_DECLARATION_PREFIX = r'\b(?:const|function|class|let|var) '
+_EXPORT_DEFAULT_PREFIX = r'\bexport default '
+
+@lru_cache(maxsize=128)
+def _declaration_re(name: str) -> Pattern[str]:
+    """Compile (once per name) a regex matching the common declaration forms of a component"""
+    # Only the name can contain metacharacters, and plain identifiers never do
+    escaped = name if name.isidentifier() else re.escape(name)
+    return re.compile(
+        _DECLARATION_PREFIX + escaped + r'\b|' + _EXPORT_DEFAULT_PREFIX + escaped + r'\b'
+    )
+
+def _read_import_header(lines: Iterator[str]) -> Tuple[str, List[str]]:
+    """
+    Consume lines up to the end of a file's import section
+    
+    Blank and comment lines (including every line of a /* ... */ block)
+    are skipped, multi-line named imports are kept together, and the scan stops after _MAX_NON_IMPORT_LINES consecutive
+    lines that are not imports (directives such as 'use client' may sit
+    between imports). The iterator is left positioned after the last
+    consumed line.
+    
+    Args:
+        lines: Iterator over source lines (a file object or io.StringIO)
+        
+    Returns:
+        Tuple of the import statements joined as text and the non-import
+        lines that were consumed
+    """
+    header = []
+    skipped = []
+    misses = 0
+    in_block_comment = False
+    for line in lines:
+        # Keep consuming lines while a multi-line import is still open
+        if header and header[-1].count('{') > header[-1].count('}'):
+            header[-1] += line
+            continue
+        stripped = line.lstrip()
+        if in_block_comment or stripped.startswith('/*'):
+            # Skip to the closing */, then look at whatever follows it
+            start = 0 if in_block_comment else 2
+            end = stripped.find('*/', start)
+            in_block_comment = end == -1
+            if in_block_comment:
+                continue
+            stripped = stripped[end + 2:].lstrip()
+            line = stripped
+        if not stripped or stripped.startswith(('//', '*')):
+            continue
+        if stripped.startswith('import'):
+            header.append(line)
+            misses = 0
+            continue
+        skipped.append(line)
+        misses += 1
+        if misses >= _MAX_NON_IMPORT_LINES:
+            break
+    return ''.join(header), skipped
+
+def _external_packages(import_paths: List[str]) -> Set[str]:
+    """Reduce import paths to external package names, skipping relative and React core imports"""
+    external_packages = set()
+    for match in import_paths:
+        if not match.startswith('.') and match not in ['react', 'react-dom']:
+            # Extract the package name (before any slash)
+            package_name = match.split('/')[0]
+            external_packages.add(sys.intern(package_name))
+    return external_packages
+
+def _read_source(filepath: str) -> str:
+    """
+    Read a UTF-8 source file with as little buffering overhead as possible
+    
+    Small files are read with a single os.read; files larger than
+    _MMAP_THRESHOLD are decoded straight from a memory map. Newlines are
+    normalized the same way text-mode open() would.
+    """
+    fd = os.open(filepath, os.O_RDONLY | getattr(os, 'O_BINARY', 0))
+    try:
+        size = os.fstat(fd).st_size
+        if size > _MMAP_THRESHOLD:
+            with mmap.mmap(fd, 0, access=mmap.ACCESS_READ) as mm:
+                data = mm[:]
+        else:
+            chunks = []
+            remaining = size
+            while True:
+                # Read until EOF in case the file grew since fstat
+                chunk = os.read(fd, max(remaining, 1 << 16))
+                if not chunk:
+                    break
+                chunks.append(chunk)
+                remaining -= len(chunk)
+            data = b''.join(chunks)
+    finally:
+        os.close(fd)
+    
+    text = data.decode('utf-8')
+    if '\r' in text:
+        text = text.replace('\r\n', '\n').replace('\r', '\n')
+    return text
+
+def _file_key(filepath: str) -> str:
+    """
+    Identify a file by its canonical path
+    
+    A path rather than (st_dev, st_ino) is used because save_content
+    replaces the file atomically, which gives it a new inode.
+    """
+    return os.path.normcase(os.path.realpath(filepath))
+
+@dataclass(eq=False)
 class Component:
     """Class representing a TSX component"""
     filepath: str
     name: str = field(init=False)
-    content: str = field(default=None)
+    _content: Optional[str] = field(default=None, repr=False)
+    _deps_cache: Optional[Tuple[int, FrozenSet[str]]] = field(default=None, init=False, repr=False, compare=False)
+    _basename: str = field(default='', init=False, repr=False, compare=False)
+    _ext: str = field(default='', init=False, repr=False, compare=False)
     
     def __post_init__(self):
         """Initialize the component name from the filepath"""
-        self.name = os.path.splitext(os.path.basename(self.filepath))[0]
-        if self.content is None:
+        self._update_path_parts()
+    
+    def __eq__(self, other: object) -> bool:
+        """Components are equal when they refer to the same file (content is not compared)"""
+        if not isinstance(other, Component):
+            return NotImplemented
+        return self.filepath == other.filepath
+    
+    def __hash__(self) -> int:
+        return hash(self.filepath)
+    
+    def _update_path_parts(self) -> None:
+        """Cache the parsed pieces of the filepath (call whenever filepath changes)"""
+        self._basename = os.path.basename(self.filepath)
+        name, self._ext = os.path.splitext(self._basename)
+        self.name = sys.intern(name)
+    
+    @property
+    def content(self) -> str:
+        """Get the component content, loading it from file on first access"""
+        if self._content is None:
             self.load_content()
+        return self._content
+    
+    @content.setter
+    def content(self, value: Optional[str]) -> None:
+        """Set the component content (None drops it so it is reloaded on next access)"""
+        self._content = value
+    
+    @property
+    def is_loaded(self) -> bool:
+        """Whether the content has been read into memory"""
+        return self._content is not None
     
     @property
     def display_name(self) -> str:
         """Get the display name for the component"""
-        return f"{self.name} ({os.path.basename(self.filepath)})"
+        return f"{self.name} ({self._basename})"
     
     @property
     def extension(self) -> str:
         """Get the file extension"""
-        _, ext = os.path.splitext(self.filepath)
-        return ext
+        return self._ext
     
     def load_content(self) -> str:
         """Load the component content from file"""
         try:
-            with open(self.filepath, 'r', encoding='utf-8') as f:
-                self.content = f.read()
-            return self.content
+            self._content = _read_source(self.filepath)
+            return self._content
         except Exception as e:
             logger.error(f"Error loading component {self.name}: {e}")
             raise IOError(f"Failed to load component: {e}")
@@ -47,7 +225,7 @@ class Component:
     # Add this method to match the expected interface
     def read_content(self) -> str:
         """Read the component content from file (alias for load_content)"""
-        return self.load_content() if self.content is None else self.content
+        return self.content
     
     def save_content(self, content: Optional[str] = None) -> bool:
         """Save content to the component file"""
@@ -55,8 +233,9 @@ class Component:
             self.content = content
             
         try:
-            with open(self.filepath, 'w', encoding='utf-8') as f:
-                f.write(self.content)
+            # Encoded by hand, so translate newlines as text mode would
+            data = self.content.replace('\n', os.linesep).encode('utf-8')
+            write_atomic(self.filepath, data, preserve_mode=True)
             return True
         except Exception as e:
             logger.error(f"Error saving component {self.name}: {e}")
@@ -70,35 +249,51 @@ class Component:
             new_name: The new component name
             
         Returns:
-            The old filepath (useful if you want to delete it)
+            The old filepath (useful if you want to delete it). When the
+            rename only changes case on a case-insensitive filesystem the file
+            is moved in place, so the old path names the renamed file itself.
         """
         # Create new file path
         dir_path = os.path.dirname(self.filepath)
         new_filename = f"{new_name}{self.extension}"
         new_filepath = os.path.join(dir_path, new_filename)
         
-        # Check if file exists
-        if os.path.exists(new_filepath) and os.path.realpath(new_filepath) != os.path.realpath(self.filepath):
-            raise FileExistsError(f"A file named {new_filename} already exists")
+        # Check if file exists (and is not just this component under another spelling)
+        is_same_file = False
+        if os.path.exists(new_filepath):
+            try:
+                is_same_file = os.path.samefile(new_filepath, self.filepath)
+            except OSError:
+                pass
+            if not is_same_file:
+                raise FileExistsError(f"A file named {new_filename} already exists")
         
         # Update references in content
-        self.update_component_references(new_name)
+        content_changed = self.update_component_references(new_name)
         
         # Save to new path if different
         old_filepath = self.filepath
-        if new_filepath != self.filepath:
+        if is_same_file and new_filepath != self.filepath:
+            # Only the case differs on a case-insensitive filesystem: save in
+            # place and move the entry, as writing new_filepath would just
+            # overwrite this same file under its old spelling
+            self.save_content()
+            os.replace(self.filepath, new_filepath)
+            self.filepath = new_filepath
+        elif new_filepath != self.filepath:
             # Create new file
             with open(new_filepath, 'w', encoding='utf-8') as f:
                 f.write(self.content)
                 
             # Update component info
             self.filepath = new_filepath
-        else:
+        elif content_changed:
             # Just save the updated content
             self.save_content()
             
-        # Update name
-        self.name = new_name
+        # Update name and cached path parts
+        self._update_path_parts()
+        self.name = sys.intern(new_name)
         
         return old_filepath
     
@@ -121,75 +316,123 @@ class Component:
         if os.path.exists(new_filepath):
             raise FileExistsError(f"A file named {new_filename} already exists")
         
-        # Create a copy of the content with updated references
-        content_copy = self.content
-        
-        # Update component name in content
-        for pattern, replacement in [
-            (f"const {self.name}", f"const {new_name}"),
-            (f"function {self.name}", f"function {new_name}"),
-            (f"class {self.name}", f"class {new_name}"),
-            (f"export default {self.name}", f"export default {new_name}"),
-            (f"const {self.name} = ", f"const {new_name} = "),
-            (f"let {self.name} = ", f"let {new_name} = "),
-            (f"var {self.name} = ", f"var {new_name} = ")
-        ]:
-            if re.search(r'\b' + re.escape(pattern) + r'\b', content_copy):
-                content_copy = re.sub(r'\b' + re.escape(pattern) + r'\b', replacement, content_copy)
-        
-        # Write to new file
-        with open(new_filepath, 'w', encoding='utf-8') as f:
-            f.write(content_copy)
+        # Copy the file as-is, then patch the declarations in the copy
+        shutil.copyfile(self.filepath, new_filepath)
+        
+        declaration_re, replace = self._build_rename_regex(self.name, new_name)
+        with open(new_filepath, 'r+', encoding='utf-8', newline='') as f:
+            original = f.read()
+            content_copy, count = declaration_re.subn(replace, original)
+            if count:
+                f.seek(0)
+                f.truncate()
+                f.write(content_copy)
         
         # Create and return a new component
         return Component(new_filepath)
     
-    def update_component_references(self, new_name: str) -> None:
+    @staticmethod
+    def _build_rename_regex(old_name: str, new_name: str) -> Tuple[Pattern[str], Callable[[Match[str]], str]]:
+        """
+        Get the declaration regex for a component name and its replacement function
+        
+        Args:
+            old_name: The current component name
+            new_name: The name to substitute
+            
+        Returns:
+            Tuple of the compiled pattern and a callable for Pattern.sub
+        """
+        def replace(match: Match[str]) -> str:
+            return match.group(0)[:-len(old_name)] + new_name
+        
+        return _declaration_re(old_name), replace
+    
+    def update_component_references(self, new_name: str) -> bool:
         """
         Update references to the component name in the content
         
         Args:
             new_name: The new component name
+            
+        Returns:
+            True if any reference was updated
         """
-        # Patterns for common component declarations
-        for pattern, replacement in [
-            (f"const {self.name}", f"const {new_name}"),
-            (f"function {self.name}", f"function {new_name}"),
-            (f"class {self.name}", f"class {new_name}"),
-            (f"export default {self.name}", f"export default {new_name}"),
-            (f"const {self.name} = ", f"const {new_name} = "),
-            (f"let {self.name} = ", f"let {new_name} = "),
-            (f"var {self.name} = ", f"var {new_name} = ")
-        ]:
-            if re.search(r'\b' + re.escape(pattern) + r'\b', self.content):
-                self.content = re.sub(r'\b' + re.escape(pattern) + r'\b', replacement, self.content)
-    
-    def get_dependencies(self) -> Set[str]:
+        # Single pass over all common component declarations
+        declaration_re, replace = self._build_rename_regex(self.name, new_name)
+        content, count = declaration_re.subn(replace, self.content)
+        if count:
+            self.content = content
+        return count > 0
+    
+    def get_dependencies(self) -> FrozenSet[str]:
         """
         Extract dependencies from the component
         
+        The result is cached against a hash of the content, so repeated calls
+        on unchanged content do not rescan the source.
+        
         Returns:
             Set of dependency package names
         """
-        # Regular expression to match import statements
-        import_pattern = r"import\s+(?:{[^}]*}|\*\s+as\s+[a-zA-Z_][a-zA-Z0-9_]*|[a-zA-Z_][a-zA-Z0-9_]*)\s+from\s+['\"]([^'\"]+)['\"]"
-        matches = re.findall(import_pattern, self.content)
-        
-        # Filter out relative imports and React core packages
-        external_packages = set()
-        for match in matches:
-            if not match.startswith('.') and match not in ['react', 'react-dom']:
-                # Extract the package name (before any slash)
-                package_name = match.split('/')[0]
-                external_packages.add(package_name)
+        content_hash = hash(self.content)
+        if self._deps_cache is not None and self._deps_cache[0] == content_hash:
+            return self._deps_cache[1]
+        
+        # Imports live at the top of the file, so stop once the header is over
+        header_text, _ = _read_import_header(io.StringIO(self.content))
+        external_packages = _external_packages(_IMPORT_RE.findall(header_text))
         
         # Special handling for lucide-react which is used in many components
-        if 'lucide-react' not in external_packages and any(icon in self.content for icon in 
-                                                      ['Server', 'Database', 'Globe', 'Users', 
-                                                      'Network', 'Shield', 'Activity']):
+        if 'lucide-react' not in external_packages and _LUCIDE_ICON_RE.search(self.content):
             external_packages.add('lucide-react')
         
-        return external_packages
+        dependencies = frozenset(external_packages)
+        self._deps_cache = (content_hash, dependencies)
+        return dependencies
+    
+    def dependencies(self) -> FrozenSet[str]:
+        """
+        Extract dependencies without loading the component
+        
+        Loaded components use the content-cached get_dependencies, while
+        components never opened are streamed from disk instead of being
+        pulled into memory.
+        
+        Returns:
+            Set of dependency package names
+        """
+        if self.is_loaded:
+            return self.get_dependencies()
+        return Component.scan_dependencies(self.filepath)
+    
+    @classmethod
+    def scan_dependencies(cls, filepath: str) -> FrozenSet[str]:
+        """
+        Extract dependencies by streaming the file from disk
+        
+        Imports are only collected from the header of the file, so the
+        content is never held in memory as a whole. The rest of the file is
+        only read while looking for lucide icon usage.
+        
+        Args:
+            filepath: Path to the component file
+            
+        Returns:
+            Set of dependency package names
+        """
+        with open(filepath, 'r', encoding='utf-8') as f:
+            header_text, skipped_lines = _read_import_header(f)
+            external_packages = _external_packages(_IMPORT_RE.findall(header_text))
+            
+            # Special handling for lucide-react which is used in many components
+            if 'lucide-react' not in external_packages and (
+                    _LUCIDE_ICON_RE.search(header_text)
+                    or any(_LUCIDE_ICON_RE.search(line) for line in skipped_lines)
+                    or any(_LUCIDE_ICON_RE.search(line) for line in f)):
+                external_packages.add('lucide-react')
+        
+        return frozenset(external_packages)
     
     def prettify(self) -> None:
         """
@@ -197,11 +440,12 @@ class Component:
         """
         # For production, you would use a proper formatter like prettier
         # This is a very simple placeholder implementation
-        lines = self.content.split('\n')
+        content = self.content
         formatted_lines = []
         indent_level = 0
         
-        for line in lines:
+        # Stream lines instead of materializing a list of them with split()
+        for line in io.StringIO(content):
             # Trim trailing whitespace
             trimmed = line.rstrip()
             
@@ -209,19 +453,25 @@ class Component:
             if not trimmed:
                 formatted_lines.append('')
                 continue
+            
+            # Only presence matters, so short-circuiting substring checks beat counting
+            opens = '(' in trimmed or '{' in trimmed or '[' in trimmed
+            closes = ')' in trimmed or '}' in trimmed or ']' in trimmed
                 
             # Adjust indent for closing brackets
-            if any(c in trimmed for c in [')', '}', ']']):
-                if not any(c in trimmed for c in ['(', '{', '[']):
-                    indent_level = max(0, indent_level - 1)
+            if closes and not opens:
+                indent_level = max(0, indent_level - 1)
             
             # Add the line with proper indentation
-            formatted_lines.append('  ' * indent_level + trimmed)
+            formatted_lines.append(_indent(indent_level) + trimmed)
             
             # Adjust indent for opening brackets
-            if any(c in trimmed for c in ['(', '{', '[']):
-                if not any(c in trimmed for c in [')', '}', ']']):
-                    indent_level += 1
+            if opens and not closes:
+                indent_level += 1
+        
+        # split('\n') would have produced a final empty line here
+        if content.endswith('\n'):
+            formatted_lines.append('')
         
         self.content = '\n'.join(formatted_lines)
         
@@ -229,7 +479,13 @@ class Component:
 class ComponentManager:
     """Class for managing multiple components"""
     def __init__(self):
-        self.components: List[Component] = []
+        # Canonical path -> component, in insertion order (which is list order)
+        self._by_path: Dict[str, Component] = {}
+    
+    @property
+    def components(self) -> List[Component]:
+        """Get all components in the order they were added"""
+        return list(self._by_path.values())
     
     def add_component(self, filepath: str) -> Component:
         """
@@ -242,14 +498,36 @@ class ComponentManager:
             The added Component instance
         """
         # Check if component is already added
-        for component in self.components:
-            if os.path.samefile(component.filepath, filepath):
-                return component
+        existing = self.get_component_by_path(filepath)
+        if existing is not None:
+            return existing
         
         # Create new component
-        component = Component(filepath)
-        self.components.append(component)
-        return component
+        return self.add_component_instance(Component(filepath))
+    
+    def add_component_instance(self, component: Component) -> Component:
+        """
+        Add an already constructed component (e.g. the result of duplicate)
+        
+        Args:
+            component: The component to add
+            
+        Returns:
+            The added Component instance, or the existing one for the same file
+        """
+        return self._by_path.setdefault(_file_key(component.filepath), component)
+    
+    def get_component_by_path(self, filepath: str) -> Optional[Component]:
+        """
+        Get the component backed by the given file, if it has been added
+        
+        Args:
+            filepath: Path to the component file
+            
+        Returns:
+            The Component instance or None if not found
+        """
+        return self._by_path.get(_file_key(filepath))
     
     def remove_component(self, component: Component) -> None:
         """
@@ -258,8 +536,33 @@ class ComponentManager:
         Args:
             component: The component to remove
         """
-        if component in self.components:
-            self.components.remove(component)
+        key = _file_key(component.filepath)
+        if self._by_path.get(key) is component:
+            del self._by_path[key]
+    
+    def rename_component(self, component: Component, new_name: str) -> str:
+        """
+        Rename a managed component and re-key it under its new file
+        
+        Args:
+            component: The component to rename
+            new_name: The new component name
+            
+        Returns:
+            The old filepath (useful if you want to delete it)
+        """
+        old_key = _file_key(component.filepath)
+        old_filepath = component.rename(new_name)
+        new_key = _file_key(component.filepath)
+        
+        if new_key != old_key and self._by_path.get(old_key) is component:
+            # Rebuild rather than pop and insert so the list order is kept
+            self._by_path = {
+                new_key if key == old_key else key: known
+                for key, known in self._by_path.items()
+            }
+        
+        return old_filepath
     
     def get_component_by_index(self, index: int) -> Optional[Component]:
         """
@@ -271,22 +574,28 @@ class ComponentManager:
         Returns:
             The Component instance or None if not found
         """
-        if 0 <= index < len(self.components):
-            return self.components[index]
+        if 0 <= index < len(self._by_path):
+            return next(islice(self._by_path.values(), index, None))
         return None
     
-    def get_all_dependencies(self) -> Dict[str, Set[str]]:
+    def get_all_dependencies(self) -> Dict[str, FrozenSet[str]]:
         """
         Get all dependencies from all components
         
         Returns:
             Dictionary mapping component names to their dependencies
         """
-        dependencies = {}
-        for component in self.components:
-            dependencies[component.name] = component.get_dependencies()
-        return dependencies
+        def scan(component: Component) -> Tuple[str, FrozenSet[str]]:
+            return component.name, component.dependencies()
+        
+        components = self.components
+        if len(components) < 2:
+            return dict(map(scan, components))
+        
+        # Overlap file reads (and the GIL-releasing parts of the regex scans)
+        with ThreadPoolExecutor(max_workers=min(_MAX_SCAN_WORKERS, len(components))) as executor:
+            return dict(executor.map(scan, components))
     
     def clear(self) -> None:
         """Clear all components"""
-        self.components = []
\ No newline at end of file
+        self._by_path.clear()
\ No newline at end of file
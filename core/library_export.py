@@ -1,20 +1,352 @@
 """
 Module for exporting components as a reusable component library
 """
+import io
 import os
-import json
 import shutil
 import subprocess
 import logging
 import platform
 import time
-from typing import List, Dict, Any, Callable, Optional, Set
+import tarfile
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Callable, Optional, Set, Tuple, Union
 import re
 
 from core.component import Component
+from utils.file_utils import MAX_WRITE_WORKERS, dump_json, run_parallel, write_bytes
 
 logger = logging.getLogger(__name__)
 
+# Per-component templates; ${ComponentName} is replaced with the camelCase name
+_TYPE_DEFINITION_TEMPLATE = """import { ReactNode } from 'react';
+
+export interface ${ComponentName}Props {
+  /** Optional children content */
+  children?: ReactNode;
+  /** Optional CSS class name */
+  className?: string;
+  /** Optional component style */
+  style?: React.CSSProperties;
+}
+
+/**
+ * ${ComponentName} component
+ */
+export declare function ${ComponentName}(props: ${ComponentName}Props): JSX.Element;
+"""
+
+_STORY_TEMPLATE = """import React from 'react';
+import { ${ComponentName} } from '../src/components/${ComponentName}';
+
+export default {
+  title: 'Components/${ComponentName}',
+  component: ${ComponentName},
+  parameters: {
+    layout: 'centered',
+  },
+  tags: ['autodocs'],
+};
+
+export const Default = () => (
+  <${ComponentName} />
+);
+
+export const WithCustomProps = () => (
+  <${ComponentName} className="custom-class" />
+);
+"""
+
+# Static project files, stored pre-encoded so they are queued as-is
+_GITIGNORE_BYTES = b"""# dependencies
+/node_modules
+/.pnp
+.pnp.js
+
+# testing
+/coverage
+
+# production
+/dist
+/build
+/lib
+
+# misc
+.DS_Store
+.env.local
+.env.development.local
+.env.test.local
+.env.production.local
+
+npm-debug.log*
+yarn-debug.log*
+yarn-error.log*
+"""
+
+_STORYBOOK_PREVIEW_JS = b"""
+export const parameters = {
+  actions: { argTypesRegex: '^on[A-Z].*' },
+  controls: {
+    matchers: {
+      color: /(background|color)$/i,
+      date: /Date$/,
+    },
+  },
+};
+"""
+
+# .storybook/main.js; ${StoryExtension} is the story file extension
+_STORYBOOK_MAIN_JS_TEMPLATE = b"""
+module.exports = {
+  stories: ['../stories/**/*.stories.${StoryExtension}'],
+  addons: [
+    '@storybook/addon-links',
+    '@storybook/addon-essentials',
+  ],
+  framework: {
+    name: '@storybook/react-webpack5',
+    options: {}
+  },
+  docs: {
+    autodocs: true
+  }
+};
+"""
+
+# Both main.js variants, keyed by whether the library uses TypeScript
+_STORYBOOK_MAIN_JS = {
+    True: _STORYBOOK_MAIN_JS_TEMPLATE.replace(b"${StoryExtension}", b"tsx"),
+    False: _STORYBOOK_MAIN_JS_TEMPLATE.replace(b"${StoryExtension}", b"jsx"),
+}
+
+# Always listed in the generated dependencies, so never added as "latest"
+_BASE_DEPENDENCIES = frozenset({"react", "react-dom"})
+
+# One line of src/index per component; {0} is the camelCase name
+_INDEX_EXPORT_LINE = "export {{ default as {0} }} from './components/{0}';"
+
+# devDependencies of the generated package.json, in the order they are listed
+_TYPES_DEV_DEPENDENCIES = {
+    "@types/react": "^18.2.15",
+    "@types/react-dom": "^18.2.7",
+}
+
+_BUILD_TOOL_DEV_DEPENDENCIES = {
+    'rollup': {
+        "rollup": "^3.26.0",
+        "@rollup/plugin-node-resolve": "^15.1.0",
+        "@rollup/plugin-commonjs": "^25.0.2",
+        "@rollup/plugin-babel": "^6.0.3",
+        "@rollup/plugin-typescript": "^11.1.2",
+        "rollup-plugin-peer-deps-external": "^2.2.4",
+        "rollup-plugin-terser": "^7.0.2",
+    },
+    'webpack': {
+        "webpack": "^5.88.1",
+        "webpack-cli": "^5.1.4",
+        "babel-loader": "^9.1.2",
+        "ts-loader": "^9.4.4",
+    },
+}
+
+_BABEL_DEV_DEPENDENCIES = {
+    "@babel/core": "^7.22.5",
+    "@babel/preset-env": "^7.22.5",
+    "@babel/preset-react": "^7.22.5",
+    "@babel/preset-typescript": "^7.22.5",
+}
+
+_STORYBOOK_DEV_DEPENDENCIES = {
+    "storybook": "^7.0.24",
+    "@storybook/react": "^7.0.24",
+    "@storybook/react-webpack5": "^7.0.24",
+    "@storybook/blocks": "^7.0.24",
+    "@storybook/addon-links": "^7.0.24",
+    "@storybook/addon-essentials": "^7.0.24",
+}
+
+# package.json scripts added when Storybook is enabled
+_STORYBOOK_SCRIPTS = {
+    "storybook": "storybook dev -p 6006",
+    "build-storybook": "storybook build",
+}
+
+# Packages only needed when the library is written in TypeScript
+_TYPESCRIPT_ONLY_DEV_DEPENDENCIES = frozenset({
+    "@rollup/plugin-typescript",
+    "ts-loader",
+    "@babel/preset-typescript",
+})
+
+# (build tool, use TypeScript) -> devDependencies without Storybook
+_DEV_DEPENDENCIES = {
+    (tool, use_typescript): {
+        name: version
+        for name, version in {**_TYPES_DEV_DEPENDENCIES, **tool_deps, **_BABEL_DEV_DEPENDENCIES}.items()
+        if use_typescript or name not in _TYPESCRIPT_ONLY_DEV_DEPENDENCIES
+    }
+    for tool, tool_deps in _BUILD_TOOL_DEV_DEPENDENCIES.items()
+    for use_typescript in (True, False)
+}
+
+def _mkdir_exist_ok(path: str) -> None:
+    """Create a single directory, ignoring it if it already exists (no ancestor stat walk)"""
+    try:
+        os.mkdir(path)
+    except FileExistsError:
+        pass
+
+def _render_rollup_config(use_typescript: bool) -> str:
+    """Render rollup.config.js for one TypeScript setting"""
+    # Modified to avoid Pylance error with terser
+    return f"""import resolve from '@rollup/plugin-node-resolve';
+    import commonjs from '@rollup/plugin-commonjs';
+    import babel from '@rollup/plugin-babel';
+    {f"import typescript from '@rollup/plugin-typescript';" if use_typescript else ""}
+    import {{ terser }} from 'rollup-plugin-terser';  # noqa: F821
+    import peerDepsExternal from 'rollup-plugin-peer-deps-external';
+    import pkg from './package.json';
+
+    export default {{
+    input: 'src/index.{f"ts" if use_typescript else "js"}',
+    output: [
+        {{
+        file: pkg.main,
+        format: 'cjs',
+        sourcemap: true,
+        }},
+        {{
+        file: pkg.module,
+        format: 'esm',
+        sourcemap: true,
+        }},
+    ],
+    plugins: [
+        peerDepsExternal(),
+        resolve(),
+        commonjs(),
+        {f"typescript({{}})," if use_typescript else ""}
+        babel({{
+        babelHelpers: 'bundled',
+        exclude: 'node_modules/**',
+        presets: [
+            '@babel/preset-env',
+            '@babel/preset-react',
+            {f"'@babel/preset-typescript'," if use_typescript else ""}
+        ],
+        }}),
+        terser(),
+    ],
+    external: Object.keys(pkg.peerDependencies || {{}})
+    }};
+    """
+
+def _render_webpack_config(use_typescript: bool) -> str:
+    """Render webpack.config.js for one TypeScript setting, leaving ${LibraryName} in place"""
+    return f"""const path = require('path');
+
+module.exports = {{
+  mode: 'production',
+  entry: './src/index.{f"ts" if use_typescript else "js"}',
+  output: {{
+    path: path.resolve(__dirname, 'dist'),
+    filename: 'index.js',
+    libraryTarget: 'umd',
+    library: '${{LibraryName}}',
+    umdNamedDefine: true,
+    globalObject: 'this',
+  }},
+  resolve: {{
+    extensions: ['.js', '.jsx'{f", '.ts', '.tsx'" if use_typescript else ""}],
+  }},
+  module: {{
+    rules: [
+      {f"""{{
+        test: /\\.tsx?$/,
+        use: 'ts-loader',
+        exclude: /node_modules/,
+      }},""" if use_typescript else ""}
+      {{
+        test: /\\.jsx?$/,
+        exclude: /node_modules/,
+        use: {{
+          loader: 'babel-loader',
+          options: {{
+            presets: [
+              '@babel/preset-env',
+              '@babel/preset-react',
+              {f"'@babel/preset-typescript'," if use_typescript else ""}
+            ],
+          }},
+        }},
+      }},
+    ],
+  }},
+  externals: {{
+    react: 'React',
+    'react-dom': 'ReactDOM',
+  }},
+}};
+"""
+
+# Build configs only vary with the TypeScript setting, so render both variants at import
+_ROLLUP_CONFIGS = {
+    use_typescript: _render_rollup_config(use_typescript).encode('utf-8')
+    for use_typescript in (True, False)
+}
+
+_WEBPACK_CONFIG_TEMPLATES = {
+    use_typescript: _render_webpack_config(use_typescript).encode('utf-8')
+    for use_typescript in (True, False)
+}
+
+class _FileWriteBatch:
+    """Collects generated files in memory so they can be written out in one pass"""
+    
+    def __init__(self):
+        self._pending: List[Tuple[str, bytes]] = []
+    
+    def add(self, path: str, content: Union[str, bytes]) -> None:
+        """Queue a file to be written on the next flush (safe to call from worker threads)"""
+        if isinstance(content, str):
+            content = content.encode('utf-8')
+        self._pending.append((path, content))
+    
+    def flush(self) -> None:
+        """Write all queued files and empty the batch"""
+        pending, self._pending = self._pending, []
+        run_parallel(write_bytes, pending)
+    
+    def flush_to_archive(self, archive_path: str, root: str) -> None:
+        """
+        Write all queued files into a single tar archive and empty the batch
+        
+        The archive is built next to its destination and renamed into place,
+        so the destination filesystem sees one file instead of one per
+        generated file.
+        
+        Args:
+            archive_path: Path of the .tar file to create
+            root: Directory the queued paths are made relative to
+        """
+        pending, self._pending = self._pending, []
+        tmp_path = archive_path + '.tmp'
+        mtime = time.time()
+        try:
+            with tarfile.open(tmp_path, 'w') as tar:
+                for path, data in pending:
+                    info = tarfile.TarInfo(os.path.relpath(path, root).replace(os.sep, '/'))
+                    info.size = len(data)
+                    info.mtime = mtime
+                    info.mode = 0o644
+                    tar.addfile(info, io.BytesIO(data))
+            os.replace(tmp_path, archive_path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
 class LibraryExporter:
     """Class for exporting components as a reusable library"""
     
@@ -31,6 +363,7 @@ class LibraryExporter:
         self.export_dir = None
         self.lib_dir = None
         self.all_dependencies = set()
+        self._writes = _FileWriteBatch()
     
     def export(self, export_dir: str, options: Optional[Dict[str, Any]] = None) -> str:
         """
@@ -39,24 +372,30 @@ class LibraryExporter:
         Args:
             export_dir: Directory to export to
             options: Library options including name, version, etc.
+                With 'archive' set, the library is written as a single
+                <name>.tar in export_dir instead of a directory tree.
             
         Returns:
-            Path to the exported library
+            Path to the exported library (the .tar file in archive mode)
         """
         options = options or {}
         self.export_dir = export_dir
         self.lib_dir = os.path.join(export_dir, options.get('name', 'component-library'))
         
+        # Directory prefixes (with trailing separator) for per-component files
+        self._components_prefix = os.path.join(self.lib_dir, "src", "components", "")
+        self._stories_prefix = os.path.join(self.lib_dir, "stories", "")
+        
         try:
             # Validate options
             self._validate_options(options)
             
-            # Create the library directory structure
-            self._create_library_structure(options)
-            
             # Scan dependencies
             self._scan_dependencies()
             
+            # Convert every component name to camelCase once up front
+            self._name_map = {c.name: self._to_camel_case(c.name) for c in self.components}
+            
             # Copy and process components
             self._process_components(options)
             
@@ -73,6 +412,17 @@ class LibraryExporter:
             if options.get('storybook', False):
                 self._setup_storybook(options)
             
+            # Everything above only generated content in memory; touch the
+            # disk in one pass now, directories first and then the queued files
+            if options['archive']:
+                os.makedirs(export_dir, exist_ok=True)
+                archive_path = f"{self.lib_dir}.tar"
+                self._writes.flush_to_archive(archive_path, export_dir)
+                return archive_path
+            
+            self._create_library_structure(options)
+            self._writes.flush()
+            
             return self.lib_dir
             
         except Exception as e:
@@ -97,67 +447,109 @@ class LibraryExporter:
         
         if 'storybook' not in options:
             options['storybook'] = True
+        
+        if 'archive' not in options:
+            options['archive'] = False
     
     def _create_library_structure(self, options: Dict[str, Any]):
         """Create the library directory structure"""
         self.progress("Creating library directory structure...")
         
-        # Create main directories
+        # lib_dir may need missing ancestors; everything below it is created
+        # parent-first, so a plain mkdir per directory is enough
         os.makedirs(self.lib_dir, exist_ok=True)
-        os.makedirs(os.path.join(self.lib_dir, "src"), exist_ok=True)
-        os.makedirs(os.path.join(self.lib_dir, "src", "components"), exist_ok=True)
         
+        sub_dirs = [
+            os.path.join(self.lib_dir, "src"),
+            os.path.join(self.lib_dir, "src", "components"),
+        ]
         if options.get('storybook', False):
-            os.makedirs(os.path.join(self.lib_dir, "stories"), exist_ok=True)
+            sub_dirs.append(os.path.join(self.lib_dir, "stories"))
+            sub_dirs.append(os.path.join(self.lib_dir, ".storybook"))
+        
+        for directory in sub_dirs:
+            _mkdir_exist_ok(directory)
     
     def _scan_dependencies(self):
         """Scan components for dependencies"""
         self.progress("Scanning components for dependencies...")
         
-        for component in self.components:
-            deps = component.get_dependencies()
-            self.all_dependencies.update(deps)
-            
-        self.progress(f"Found dependencies: {', '.join(self.all_dependencies) if self.all_dependencies else 'none'}")
+        found = set().union(*(component.dependencies() for component in self.components))
+        
+        self.progress(f"Found dependencies: {', '.join(found) if found else 'none'}")
+        
+        # React is always a base dependency, so leave it out of the scanned set
+        self.all_dependencies = found - _BASE_DEPENDENCIES
     
     def _process_components(self, options: Dict[str, Any]):
         """Process and copy components to the library"""
         self.progress("Processing components...")
         
-        self.component_data = []
-        extension = ".tsx" if options.get('typescript', True) else ".jsx"
+        # Resolve everything that is constant across components once
+        use_typescript = options.get('typescript', True)
+        extension = ".tsx" if use_typescript else ".jsx"
+        use_storybook = options.get('storybook', False)
+        
+        # Pre-sized so each worker fills its own slot; no lock is needed and
+        # the original component order is kept
+        component_data: List[Optional[Dict[str, str]]] = [None] * len(self.components)
+        
+        def emit(index: int) -> None:
+            component_data[index] = self._emit_component(
+                self.components[index], options, extension, use_typescript, use_storybook)
         
+        # Components are independent, so reading (content loads lazily) and
+        # processing them can overlap; iterating map re-raises worker errors
+        with ThreadPoolExecutor(max_workers=min(MAX_WRITE_WORKERS, max(1, len(self.components)))) as executor:
+            for _ in executor.map(emit, range(len(self.components))):
+                pass
+        self.component_data = component_data
+        
+        # Report progress from the calling thread only
         for component in self.components:
-            # Convert component name to camelCase for JavaScript
-            camel_case_name = self._to_camel_case(component.name)
-            
-            # Create the file path
-            file_path = os.path.join(self.lib_dir, "src", "components", f"{camel_case_name}{extension}")
-            
-            # Process the component content
-            processed_content = self._process_component_content(component.content, options)
-            
-            # Write the component content
-            with open(file_path, 'w', encoding='utf-8') as f:
-                f.write(processed_content)
-            
-            # Store component info
-            self.component_data.append({
-                "originalName": component.name,
-                "camelCaseName": camel_case_name,
-                "filePath": file_path
-            })
-            
-            # Create type definition file if using TypeScript
-            if options.get('typescript', True):
-                self._create_type_definition(component, camel_case_name)
-            
-            # Create story file if using Storybook
-            if options.get('storybook', False):
-                self._create_story_file(component, camel_case_name, options)
-            
             self.progress(f"Added component: {component.name}")
     
+    def _emit_component(self, component: Component, options: Dict[str, Any], extension: str,
+                        use_typescript: bool, use_storybook: bool) -> Dict[str, str]:
+        """
+        Queue the files generated for a single component
+        
+        Args:
+            component: The component to emit
+            options: Export options
+            extension: File extension for the component source
+            use_typescript: Whether to emit a type definition file
+            use_storybook: Whether to emit a story file
+            
+        Returns:
+            The component info stored in component_data
+        """
+        # camelCase name for JavaScript, precomputed in export()
+        camel_case_name = self._name_map[component.name]
+        
+        # Create the file path
+        file_path = f"{self._components_prefix}{camel_case_name}{extension}"
+        
+        # Process the component content
+        processed_content = self._process_component_content(component.content, options)
+        
+        # Queue the component content
+        self._writes.add(file_path, processed_content)
+        
+        # Create type definition file if using TypeScript
+        if use_typescript:
+            self._create_type_definition(camel_case_name)
+        
+        # Create story file if using Storybook
+        if use_storybook:
+            self._create_story_file(camel_case_name, extension)
+        
+        return {
+            "originalName": component.name,
+            "camelCaseName": camel_case_name,
+            "filePath": file_path
+        }
+    
     def _process_component_content(self, content: str, options: Dict[str, Any]) -> str:
         """
         Process component content for use in the library
@@ -172,85 +564,49 @@ class LibraryExporter:
         # Add library exports and imports
         # This is a simplified example - a real implementation would do more sophisticated processing
         
-        # Look for existing imports
-        import_section_end = content.find('\n\n')
-        if import_section_end == -1:  # No double newline found
-            import_section_end = content.find('\n')  # Try single newline
+        # Look for existing imports; partition stops at the first blank line
+        head, separator, tail = content.partition('\n\n')
+        if not separator:  # No double newline found
+            head, separator, tail = content.partition('\n')  # Try single newline
         
-        if import_section_end > 0:
+        if separator and head:
             # Split content into imports and component code
-            imports = content[:import_section_end].strip()
-            component_code = content[import_section_end:].strip()
+            imports = head.strip()
+            component_code = tail.strip()
             
             # Process imports if needed (e.g., adjust paths)
             processed_imports = imports
             
+            # Already in the normalized layout, so skip rebuilding the string
+            if separator == '\n\n' and len(imports) == len(head) and len(component_code) == len(tail):
+                return content
+            
             # Return combined content
             return f"{processed_imports}\n\n{component_code}"
         
         # If we couldn't find imports, return the original content
         return content
     
-    def _create_type_definition(self, component: Component, camel_case_name: str):
+    def _create_type_definition(self, camel_case_name: str):
         """Create TypeScript type definition file for a component"""
         # This is a simplified placeholder implementation
         # A real implementation would analyze the component props and generate proper types
         
-        type_def_content = """import { ReactNode } from 'react';
-
-export interface ${ComponentName}Props {
-  /** Optional children content */
-  children?: ReactNode;
-  /** Optional CSS class name */
-  className?: string;
-  /** Optional component style */
-  style?: React.CSSProperties;
-}
-
-/**
- * ${ComponentName} component
- */
-export declare function ${ComponentName}(props: ${ComponentName}Props): JSX.Element;
-"""
-        
         # Replace placeholders
-        type_def_content = type_def_content.replace("${ComponentName}", camel_case_name)
+        type_def_content = _TYPE_DEFINITION_TEMPLATE.replace("${ComponentName}", camel_case_name)
         
         # Create the file
-        type_def_path = os.path.join(self.lib_dir, "src", "components", f"{camel_case_name}.d.ts")
-        with open(type_def_path, 'w', encoding='utf-8') as f:
-            f.write(type_def_content)
+        type_def_path = f"{self._components_prefix}{camel_case_name}.d.ts"
+        self._writes.add(type_def_path, type_def_content)
     
-    def _create_story_file(self, component: Component, camel_case_name: str, options: Dict[str, Any]):
+    def _create_story_file(self, camel_case_name: str, extension: str):
         """Create a Storybook story file for a component"""
-        extension = ".tsx" if options.get('typescript', True) else ".jsx"
-        
         # Create a basic story
-        story_content = f"""import React from 'react';
-import {{ {camel_case_name} }} from '../src/components/{camel_case_name}';
-
-export default {{
-  title: 'Components/{camel_case_name}',
-  component: {camel_case_name},
-  parameters: {{
-    layout: 'centered',
-  }},
-  tags: ['autodocs'],
-}};
-
-export const Default = () => (
-  <{camel_case_name} />
-);
-
-export const WithCustomProps = () => (
-  <{camel_case_name} className="custom-class" />
-);
-"""
+        story_content = _STORY_TEMPLATE.replace("${ComponentName}", camel_case_name)
         
         # Create the file
-        story_path = os.path.join(self.lib_dir, "stories", f"{camel_case_name}.stories{extension}")
-        with open(story_path, 'w', encoding='utf-8') as f:
-            f.write(story_content)
+        story_path = f"{self._stories_prefix}{camel_case_name}.stories{extension}"
+        self._writes.add(story_path, story_content)
     
     def _create_package_files(self, options: Dict[str, Any]):
         """Create package.json and related files"""
@@ -260,33 +616,7 @@ export const WithCustomProps = () => (
         self._create_package_json(options)
         
         # Create .gitignore
-        gitignore_content = """# dependencies
-/node_modules
-/.pnp
-.pnp.js
-
-# testing
-/coverage
-
-# production
-/dist
-/build
-/lib
-
-# misc
-.DS_Store
-.env.local
-.env.development.local
-.env.test.local
-.env.production.local
-
-npm-debug.log*
-yarn-debug.log*
-yarn-error.log*
-"""
-        
-        with open(os.path.join(self.lib_dir, ".gitignore"), 'w', encoding='utf-8') as f:
-            f.write(gitignore_content)
+        self._writes.add(os.path.join(self.lib_dir, ".gitignore"), _GITIGNORE_BYTES)
         
         # Create README
         self._create_readme(options)
@@ -303,11 +633,6 @@ yarn-error.log*
         use_typescript = options.get('typescript', True)
         use_storybook = options.get('storybook', False)
         
-        # Determine main and types fields
-        main_field = "dist/index.js"
-        module_field = "dist/index.esm.js"
-        types_field = "dist/index.d.ts" if use_typescript else None
-        
         # Base dependencies
         dependencies = {
             "react": "^18.2.0",
@@ -316,75 +641,34 @@ yarn-error.log*
         
         # Add component dependencies
         for dep in self.all_dependencies:
-            if dep not in dependencies and dep not in ["react", "react-dom"]:
-                dependencies[dep] = "latest"
+            dependencies[dep] = "latest"
         
-        # Dev dependencies based on build tool
-        dev_dependencies = {
-            "@types/react": "^18.2.15",
-            "@types/react-dom": "^18.2.7",
-        }
-        
-        # Add build tool dependencies
-        if build_tool == 'rollup':
-            dev_dependencies.update({
-                "rollup": "^3.26.0",
-                "@rollup/plugin-node-resolve": "^15.1.0",
-                "@rollup/plugin-commonjs": "^25.0.2",
-                "@rollup/plugin-babel": "^6.0.3",
-                "@rollup/plugin-typescript": "^11.1.2" if use_typescript else None,
-                "rollup-plugin-peer-deps-external": "^2.2.4",
-                "rollup-plugin-terser": "^7.0.2",
-            })
-        else:  # webpack
-            dev_dependencies.update({
-                "webpack": "^5.88.1",
-                "webpack-cli": "^5.1.4",
-                "babel-loader": "^9.1.2",
-                "ts-loader": "^9.4.4" if use_typescript else None,
-            })
-        
-        # Filter out None values
-        dev_dependencies = {k: v for k, v in dev_dependencies.items() if v is not None}
-        
-        # Add Babel dependencies
-        dev_dependencies.update({
-            "@babel/core": "^7.22.5",
-            "@babel/preset-env": "^7.22.5",
-            "@babel/preset-react": "^7.22.5",
-            "@babel/preset-typescript": "^7.22.5" if use_typescript else None,
-        })
+        # Dev dependencies are precomputed per build tool / TypeScript combination
+        dev_dependencies = _DEV_DEPENDENCIES['rollup' if build_tool == 'rollup' else 'webpack', bool(use_typescript)]
+        if use_storybook:
+            dev_dependencies = {**dev_dependencies, **_STORYBOOK_DEV_DEPENDENCIES}
         
-        # Add Storybook dependencies if needed
+        # Scripts, with the Storybook ones only when Storybook is set up
+        scripts = {"build": 'rollup -c' if build_tool == 'rollup' else 'webpack --mode production'}
         if use_storybook:
-            dev_dependencies.update({
-                "storybook": "^7.0.24",
-                "@storybook/react": "^7.0.24",
-                "@storybook/react-webpack5": "^7.0.24",
-                "@storybook/blocks": "^7.0.24",
-                "@storybook/addon-links": "^7.0.24",
-                "@storybook/addon-essentials": "^7.0.24",
-            })
-        
-        # Filter out None values again
-        dev_dependencies = {k: v for k, v in dev_dependencies.items() if v is not None}
-        
-        # Create the package.json content
+            scripts.update(_STORYBOOK_SCRIPTS)
+        
+        # Create the package.json content; optional fields are only inserted
+        # when they apply, so nothing has to be filtered out afterwards
         package_json = {
             "name": package_name,
             "version": version,
             "description": "A library of React components",
-            "main": main_field,
-            "module": module_field,
-            "types": types_field,
+            "main": "dist/index.js",
+            "module": "dist/index.esm.js",
+        }
+        if use_typescript:
+            package_json["types"] = "dist/index.d.ts"
+        package_json.update({
             "files": [
                 "dist"
             ],
-            "scripts": {
-                "build": f"{'rollup -c' if build_tool == 'rollup' else 'webpack --mode production'}",
-                "storybook": "storybook dev -p 6006" if use_storybook else None,
-                "build-storybook": "storybook build" if use_storybook else None,
-            },
+            "scripts": scripts,
             "keywords": [
                 "react",
                 "component",
@@ -399,16 +683,10 @@ yarn-error.log*
                 "react": "^17.0.0 || ^18.0.0",
                 "react-dom": "^17.0.0 || ^18.0.0"
             }
-        }
-        
-        # Remove None values
-        package_json["scripts"] = {k: v for k, v in package_json["scripts"].items() if v is not None}
-        if types_field is None:
-            del package_json["types"]
+        })
         
-        # Write to file
-        with open(os.path.join(self.lib_dir, "package.json"), 'w', encoding='utf-8') as f:
-            json.dump(package_json, f, indent=2)
+        # Queue the file
+        self._writes.add(os.path.join(self.lib_dir, "package.json"), dump_json(package_json))
     
     def _create_typescript_config(self, options: Dict[str, Any]):
         """Create TypeScript configuration files"""
@@ -436,8 +714,7 @@ yarn-error.log*
             "exclude": ["node_modules", "dist", "**/*.stories.*"]
         }
         
-        with open(os.path.join(self.lib_dir, "tsconfig.json"), 'w', encoding='utf-8') as f:
-            json.dump(tsconfig, f, indent=2)
+        self._writes.add(os.path.join(self.lib_dir, "tsconfig.json"), dump_json(tsconfig))
     
     def _create_build_config(self, options: Dict[str, Any]):
         """Create build configuration files based on the selected build tool"""
@@ -451,106 +728,16 @@ yarn-error.log*
     
     def _create_rollup_config(self, options: Dict[str, Any]):
         """Create Rollup configuration file"""
-        use_typescript = options.get('typescript', True)
-        
-        # Modified to avoid Pylance error with terser
-        rollup_config = f"""import resolve from '@rollup/plugin-node-resolve';
-    import commonjs from '@rollup/plugin-commonjs';
-    import babel from '@rollup/plugin-babel';
-    {f"import typescript from '@rollup/plugin-typescript';" if use_typescript else ""}
-    import {{ terser }} from 'rollup-plugin-terser';  # noqa: F821
-    import peerDepsExternal from 'rollup-plugin-peer-deps-external';
-    import pkg from './package.json';
-
-    export default {{
-    input: 'src/index.{f"ts" if use_typescript else "js"}',
-    output: [
-        {{
-        file: pkg.main,
-        format: 'cjs',
-        sourcemap: true,
-        }},
-        {{
-        file: pkg.module,
-        format: 'esm',
-        sourcemap: true,
-        }},
-    ],
-    plugins: [
-        peerDepsExternal(),
-        resolve(),
-        commonjs(),
-        {f"typescript({{}})," if use_typescript else ""}
-        babel({{
-        babelHelpers: 'bundled',
-        exclude: 'node_modules/**',
-        presets: [
-            '@babel/preset-env',
-            '@babel/preset-react',
-            {f"'@babel/preset-typescript'," if use_typescript else ""}
-        ],
-        }}),
-        terser(),
-    ],
-    external: Object.keys(pkg.peerDependencies || {{}})
-    }};
-    """
-        
-        with open(os.path.join(self.lib_dir, "rollup.config.js"), 'w', encoding='utf-8') as f:
-            f.write(rollup_config)
+        self._writes.add(os.path.join(self.lib_dir, "rollup.config.js"),
+                         _ROLLUP_CONFIGS[bool(options.get('typescript', True))])
     
     def _create_webpack_config(self, options: Dict[str, Any]):
         """Create Webpack configuration file"""
-        use_typescript = options.get('typescript', True)
+        # Only the library name varies once the TypeScript variant is chosen
+        webpack_config = _WEBPACK_CONFIG_TEMPLATES[bool(options.get('typescript', True))].replace(
+            b"${LibraryName}", options.get("name", "component-library").encode('utf-8'))
         
-        webpack_config = f"""const path = require('path');
-
-module.exports = {{
-  mode: 'production',
-  entry: './src/index.{f"ts" if use_typescript else "js"}',
-  output: {{
-    path: path.resolve(__dirname, 'dist'),
-    filename: 'index.js',
-    libraryTarget: 'umd',
-    library: '{options.get("name", "component-library")}',
-    umdNamedDefine: true,
-    globalObject: 'this',
-  }},
-  resolve: {{
-    extensions: ['.js', '.jsx'{f", '.ts', '.tsx'" if use_typescript else ""}],
-  }},
-  module: {{
-    rules: [
-      {f"""{{
-        test: /\\.tsx?$/,
-        use: 'ts-loader',
-        exclude: /node_modules/,
-      }},""" if use_typescript else ""}
-      {{
-        test: /\\.jsx?$/,
-        exclude: /node_modules/,
-        use: {{
-          loader: 'babel-loader',
-          options: {{
-            presets: [
-              '@babel/preset-env',
-              '@babel/preset-react',
-              {f"'@babel/preset-typescript'," if use_typescript else ""}
-            ],
-          }},
-        }},
-      }},
-    ],
-  }},
-  externals: {{
-    react: 'React',
-    'react-dom': 'ReactDOM',
-  }},
-}};
-"""
-        
-        with open(os.path.join(self.lib_dir, "webpack.config.js"), 'w', encoding='utf-8') as f:
-            f.write(webpack_config)
+        self._writes.add(os.path.join(self.lib_dir, "webpack.config.js"), webpack_config)
     
     def _create_index_files(self, options: Dict[str, Any]):
         """Create index files to export all components"""
@@ -558,61 +745,28 @@ module.exports = {{
         
         extension = ".ts" if options.get('typescript', True) else ".js"
         
-        # Create index file in src directory
-        index_content = []
+        # Export each component from the index file in src, encoded in one go
+        index_content = "\n".join(
+            _INDEX_EXPORT_LINE.format(component_info['camelCaseName'])
+            for component_info in self.component_data
+        )
         
-        # Export each component
-        for component_info in self.component_data:
-            index_content.append(f"export {{ default as {component_info['camelCaseName']} }} from './components/{component_info['camelCaseName']}';")
-        
-        # Write to file
-        with open(os.path.join(self.lib_dir, "src", f"index{extension}"), 'w', encoding='utf-8') as f:
-            f.write("\n".join(index_content))
+        # Queue the file
+        self._writes.add(os.path.join(self.lib_dir, "src", f"index{extension}"), index_content)
     
     def _setup_storybook(self, options: Dict[str, Any]):
         """Set up Storybook for the component library"""
         self.progress("Setting up Storybook...")
         
-        # Create .storybook directory
+        # The .storybook directory is created with the rest of the structure
         storybook_dir = os.path.join(self.lib_dir, ".storybook")
-        os.makedirs(storybook_dir, exist_ok=True)
         
         # Create main.js
-        main_js = f"""
-module.exports = {{
-  stories: ['../stories/**/*.stories.{f"tsx" if options.get("typescript", True) else "jsx"}'],
-  addons: [
-    '@storybook/addon-links',
-    '@storybook/addon-essentials',
-  ],
-  framework: {{
-    name: '@storybook/react-webpack5',
-    options: {{}}
-  }},
-  docs: {{
-    autodocs: true
-  }}
-}};
-"""
-        
-        with open(os.path.join(storybook_dir, "main.js"), 'w', encoding='utf-8') as f:
-            f.write(main_js)
+        self._writes.add(os.path.join(storybook_dir, "main.js"),
+                         _STORYBOOK_MAIN_JS[bool(options.get("typescript", True))])
         
         # Create preview.js
-        preview_js = """
-export const parameters = {
-  actions: { argTypesRegex: '^on[A-Z].*' },
-  controls: {
-    matchers: {
-      color: /(background|color)$/i,
-      date: /Date$/,
-    },
-  },
-};
-"""
-        
-        with open(os.path.join(storybook_dir, "preview.js"), 'w', encoding='utf-8') as f:
-            f.write(preview_js)
+        self._writes.add(os.path.join(storybook_dir, "preview.js"), _STORYBOOK_PREVIEW_JS)
     
     def _create_readme(self, options: Dict[str, Any]):
         """Create a README.md file"""
@@ -661,19 +815,21 @@ function App() {{
 MIT
 """
         
-        with open(os.path.join(self.lib_dir, "README.md"), 'w', encoding='utf-8') as f:
-            f.write(readme)
+        self._writes.add(os.path.join(self.lib_dir, "README.md"), readme)
     
-    def _to_camel_case(self, name: str) -> str:
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _to_camel_case(name: str) -> str:
         """Convert a string to camelCase for component names"""
-        # Replace hyphens and underscores with spaces
+        # Replace hyphens and underscores with spaces (two replace calls
+        # measured well ahead of a str.translate table for names this short)
         s = name.replace('-', ' ').replace('_', ' ')
         # Title case each word and join without spaces
         words = s.split()
         if not words:
             return ''
         # First word lowercase, rest capitalized
-        return words[0].lower() + ''.join(word.capitalize() for word in words[1:])
+        return words[0].lower() + ''.join(map(str.capitalize, words[1:]))
 
 
 # Helper function to be called from the main application
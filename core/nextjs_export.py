@@ -2,24 +2,246 @@
 Module for exporting components to Next.js applications
 """
 import os
+import asyncio
+import hashlib
 import json
 import shutil
-import subprocess
 import logging
-import platform
-import threading
 import time
-from typing import List, Dict, Any, Callable, Optional, Set
-import tempfile
+import tarfile
+from functools import lru_cache
+from typing import List, Dict, Any, Callable, Optional, Sequence, Set, Tuple, Union
 import re
 
 from core.component import Component
+from utils.file_utils import dump_json, load_json, run_parallel, write_chunks
 
 logger = logging.getLogger(__name__)
 
+# Body shared by the per-component pages; ${ComponentName} is the camelCase
+# name, ${OriginalName} the component name and ${PageFunction} the export
+_COMPONENT_PAGE_BODY = """export default function ${PageFunction}() {
+  return (
+    <div className="container mx-auto px-4 py-8">
+      <Link href="/" className="text-blue-500 hover:underline mb-4 inline-block">
+        ← Back to all components
+      </Link>
+      
+      <h1 className="text-3xl font-bold mb-6">${OriginalName}</h1>
+      
+      <div className="border border-gray-300 rounded-lg p-6 bg-white">
+        <${ComponentName} />
+      </div>
+    </div>
+  )
+}
+"""
+
+_APP_COMPONENT_PAGE_TEMPLATE = """
+import ${ComponentName} from '@/components/${ComponentName}'
+import Link from 'next/link'
+
+""" + _COMPONENT_PAGE_BODY.replace("${PageFunction}", "Page")
+
+_PAGES_COMPONENT_PAGE_TEMPLATE = """
+import ${ComponentName} from '../components/${ComponentName}'
+import Link from 'next/link'
+import Head from 'next/head'
+
+""" + _COMPONENT_PAGE_BODY.replace("${PageFunction}", "ComponentPage")
+
+# One <li> of the index page per component; {0} is the component name and
+# {1} its route
+_APP_INDEX_LINK = (
+    '<li key="{0}" className="mb-2">\n'
+    '  <Link href="/{1}" className="text-blue-500 hover:underline">\n'
+    '    {0}\n'
+    '  </Link>\n'
+    '</li>'
+)
+
+_PAGES_INDEX_LINK = (
+    '<li key="{0}" className="mb-2">\n'
+    '  <Link href="/{1}">\n'
+    '    <a className="text-blue-500 hover:underline">{0}</a>\n'
+    '  </Link>\n'
+    '</li>'
+)
+
+# Index pages listing every component; ${ComponentLinks} is the joined <li> list
+_APP_INDEX_PAGE_TEMPLATE = """
+import Link from 'next/link'
+
+export default function Home() {
+  return (
+    <div className="container mx-auto px-4 py-8">
+      <h1 className="text-3xl font-bold mb-6">Component Gallery</h1>
+      
+      <div className="bg-white p-6 rounded-lg shadow-md">
+        <h2 className="text-xl font-semibold mb-4">Available Components</h2>
+        
+        <ul className="list-disc pl-6">
+          ${ComponentLinks}
+        </ul>
+      </div>
+    </div>
+  )
+}
+"""
+
+_PAGES_INDEX_PAGE_TEMPLATE = """
+import Head from 'next/head'
+import Link from 'next/link'
+
+export default function Home() {
+  return (
+    <div className="container mx-auto px-4 py-8">
+      <Head>
+        <title>Component Gallery</title>
+        <meta name="description" content="Gallery of components" />
+        <link rel="icon" href="/favicon.ico" />
+      </Head>
+
+      <h1 className="text-3xl font-bold mb-6">Component Gallery</h1>
+      
+      <div className="bg-white p-6 rounded-lg shadow-md">
+        <h2 className="text-xl font-semibold mb-4">Available Components</h2>
+        
+        <ul className="list-disc pl-6">
+          ${ComponentLinks}
+        </ul>
+      </div>
+    </div>
+  )
+}
+"""
+
+# README.md of the generated app; ${ComponentList} is the bullet list of components
+_README_TEMPLATE = """# Next.js Component Gallery
+
+A gallery of React components built with Next.js.
+
+## Included Components
+
+${ComponentList}
+
+## Getting Started
+
+1. Install dependencies:
+   ```
+   npm install
+   ```
+
+2. Start the development server:
+   ```
+   npm run dev
+   ```
+
+3. Open [http://localhost:3000](http://localhost:3000) to view the application.
+
+## Available Scripts
+
+- `npm run dev` - Runs the app in development mode
+- `npm run build` - Builds the app for production
+- `npm start` - Runs the built app in production mode
+- `npm run lint` - Lints the codebase
+"""
+
+_PLACEHOLDER_RE = re.compile(r'\$\{(\w+)\}')
+
+def _split_template(template: str) -> Tuple[Union[bytes, str], ...]:
+    """
+    Pre-encode a ${...} template into alternating parts
+    
+    Even positions are UTF-8 encoded literal text and odd positions are
+    placeholder names, so rendering never re-encodes the constant text.
+    """
+    return tuple(
+        part if index % 2 else part.encode('utf-8')
+        for index, part in enumerate(_PLACEHOLDER_RE.split(template))
+    )
+
+def _render_segments(segments: Tuple[Union[bytes, str], ...], values: Dict[str, bytes]) -> List[bytes]:
+    """Fill the placeholders of a split template, returning the chunks to write"""
+    return [values[part] if index % 2 else part for index, part in enumerate(segments)]
+
+_APP_COMPONENT_PAGE_SEGMENTS = _split_template(_APP_COMPONENT_PAGE_TEMPLATE)
+_PAGES_COMPONENT_PAGE_SEGMENTS = _split_template(_PAGES_COMPONENT_PAGE_TEMPLATE)
+_APP_INDEX_PAGE_SEGMENTS = _split_template(_APP_INDEX_PAGE_TEMPLATE)
+_PAGES_INDEX_PAGE_SEGMENTS = _split_template(_PAGES_INDEX_PAGE_TEMPLATE)
+_README_SEGMENTS = _split_template(_README_TEMPLATE)
+
+# Tarballs of create-next-app output, one per combination of scaffold options
+_SKELETON_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".tsx_component_manager", "nextjs-skeletons")
+
+# create-next-app@latest moves on, so a cached skeleton is only reused for a week
+_SKELETON_MAX_AGE = 7 * 24 * 60 * 60
+
+def _skeleton_cache_path(options: Dict[str, Any]) -> str:
+    """Return the cache file for the create-next-app options in use"""
+    # The 'version' option is not part of the key: the scaffold always comes
+    # from create-next-app@latest, whatever version is requested
+    key = json.dumps({
+        'typescript': bool(options.get('typescript', True)),
+        'eslint': bool(options.get('eslint', True)),
+        'tailwind': bool(options.get('tailwind', True)),
+        'app_router': options.get('router') == 'app',
+    }, sort_keys=True)
+    digest = hashlib.blake2b(key.encode('utf-8'), digest_size=8).hexdigest()
+    return os.path.join(_SKELETON_CACHE_DIR, f"skeleton-{digest}.tar")
+
+def _skeleton_is_fresh(cache_path: str) -> bool:
+    """Whether a cached skeleton exists and is recent enough to reuse"""
+    try:
+        return time.time() - os.path.getmtime(cache_path) < _SKELETON_MAX_AGE
+    except OSError:
+        return False
+
+def _ensure_dir(directory: str, known_dirs: Set[str]) -> None:
+    """
+    Create a directory unless it is already known to exist
+    
+    A plain mkdir is tried first, so a directory whose parent exists costs
+    one syscall instead of makedirs' stat of the parent plus mkdir; missing
+    parents are only walked up to when that mkdir reports them missing.
+    """
+    if directory in known_dirs:
+        return
+    try:
+        os.mkdir(directory)
+    except FileExistsError:
+        pass
+    except FileNotFoundError:
+        _ensure_dir(os.path.dirname(directory), known_dirs)
+        os.makedirs(directory, exist_ok=True)
+    known_dirs.add(directory)
+
+def _write_files(pending: List[Tuple[str, Sequence[bytes]]], copies: Sequence[Tuple[str, str]] = ()) -> None:
+    """Write queued (path, chunks) pairs and (source, path) copies, creating parent directories as needed"""
+    # Create each needed directory once, shortest path first so parents
+    # already exist by the time their children are made
+    known_dirs: Set[str] = set()
+    targets = [path for path, _ in pending] + [path for _, path in copies]
+    for directory in sorted({os.path.dirname(path) for path in targets}, key=len):
+        _ensure_dir(directory, known_dirs)
+    
+    # shutil.copyfile has the kernel move the data (sendfile on Linux,
+    # fcopyfile on macOS), so copied payloads never pass through Python
+    jobs = [(write_chunks, path, chunks) for path, chunks in pending]
+    jobs += [(shutil.copyfile, source, path) for source, path in copies]
+    run_parallel(lambda func, *args: func(*args), jobs)
+
+async def _drain_lines(stream: asyncio.StreamReader, sink: Callable[[str], None]) -> None:
+    """Pass each line of a subprocess pipe to sink until the pipe closes"""
+    async for line in stream:
+        sink(line.decode('utf-8').strip())
+
 class NextJSExporter:
     """Class for exporting components to a Next.js application"""
     
+    # Resolved path of the npx executable, looked up on first use
+    _npx_path: Optional[str] = None
+    
     def __init__(self, components: List[Component], progress_callback: Callable[[str], None]):
         """
         Initialize the Next.js exporter
@@ -30,17 +252,26 @@ class NextJSExporter:
         """
         self.components = components
         self.progress = progress_callback
+        # Progress sink for the work done on worker threads; export buffers it
+        # so the callback only ever runs on the calling thread
+        self._report = progress_callback
         self.export_dir = None
         self.app_dir = None
         self.all_dependencies = set()
+        self._pending_writes: List[Tuple[str, Sequence[bytes]]] = []
+        self._pending_copies: List[Tuple[str, str]] = []
+        self._skeleton_restored = False
     
-    def export(self, export_dir: str, options: Optional[Dict[str, Any]] = None) -> str:
+    async def export(self, export_dir: str, options: Optional[Dict[str, Any]] = None) -> str:
         """
         Export components to a Next.js application
         
         Args:
             export_dir: Directory to export to
             options: Export options including Next.js version, router type, etc.
+                'cache_skeleton' (default True) reuses an archive of an earlier
+                create-next-app run with the same options for up to a week; the
+                archive includes node_modules, so it is several hundred MB
             
         Returns:
             Path to the exported application
@@ -49,30 +280,44 @@ class NextJSExporter:
         self.export_dir = export_dir
         self.app_dir = os.path.join(export_dir, options.get('app_name', 'nextjs-components-app'))
         
+        # Directory prefixes (with trailing separator) for the generated files
+        self._app_prefix = os.path.join(self.app_dir, "")
+        self._components_prefix = os.path.join(self.app_dir, "components", "")
+        self._app_router_prefix = os.path.join(self.app_dir, "app", "")
+        self._pages_prefix = os.path.join(self.app_dir, "pages", "")
+        
         try:
             # Validate options
             self._validate_options(options)
             
-            # Use npx create-next-app to create the Next.js application
-            self._create_nextjs_app(options)
-            
-            # Scan dependencies
-            self._scan_dependencies()
-            
-            # Copy components
-            self._copy_components(options)
-            
-            # Create pages or app routes based on router type
-            self._create_routes(options)
-            
-            # Create layout and theme files
-            self._create_layout_files(options)
-            
-            # Update package.json with additional dependencies
-            self._update_package_json(options)
-            
-            # Create README
-            self._create_readme()
+            # Messages from the worker threads are held back and reported
+            # from this thread once each batch of thread work has finished
+            buffered: List[str] = []
+            self._report = buffered.append
+            try:
+                # create-next-app refuses to scaffold into a non-empty directory, so
+                # run it in the background and render our files in memory meanwhile
+                scaffold = asyncio.create_task(self._create_nextjs_app(options))
+                try:
+                    await asyncio.to_thread(self._render_app_files, options)
+                finally:
+                    # Wait for the application skeleton before touching the disk
+                    await scaffold
+                    self._emit_buffered(buffered)
+                
+                # Writing the queued files and merging package.json touch
+                # different files, so do both at once on worker threads
+                try:
+                    await asyncio.gather(
+                        # Write everything queued above in one pass
+                        asyncio.to_thread(self._flush_writes),
+                        # Update package.json with additional dependencies
+                        asyncio.to_thread(self._update_package_json, options)
+                    )
+                finally:
+                    self._emit_buffered(buffered)
+            finally:
+                self._report = self.progress
             
             return self.app_dir
             
@@ -81,6 +326,29 @@ class NextJSExporter:
             self.progress(f"Error: {str(e)}")
             raise
     
+    def _emit_buffered(self, buffered: List[str]) -> None:
+        """Pass buffered worker-thread messages to the progress callback and clear them"""
+        for message in buffered:
+            self.progress(message)
+        buffered.clear()
+    
+    def _render_app_files(self, options: Dict[str, Any]):
+        """Render every file that does not depend on the app skeleton into the write queue"""
+        # Scan dependencies
+        self._scan_dependencies()
+        
+        # Copy components
+        self._copy_components(options)
+        
+        # Create pages or app routes based on router type
+        self._create_routes(options)
+        
+        # Create layout and theme files
+        self._create_layout_files(options)
+        
+        # Create README (replacing the one create-next-app writes)
+        self._create_readme()
+    
     def _validate_options(self, options: Dict[str, Any]):
         """Validate export options"""
         # Set defaults for missing options
@@ -95,13 +363,27 @@ class NextJSExporter:
         
         if 'tailwind' not in options:
             options['tailwind'] = True
+        
+        if 'cache_skeleton' not in options:
+            options['cache_skeleton'] = True
     
-    def _create_nextjs_app(self, options: Dict[str, Any]):
+    async def _create_nextjs_app(self, options: Dict[str, Any]):
         """Create a new Next.js application using npx create-next-app"""
         self.progress("Creating Next.js application...")
         
+        # Reuse the output of an earlier run with the same options; like
+        # create-next-app itself, only ever unpack into an empty directory
+        use_cache = options.get('cache_skeleton', True)
+        cache_path = _skeleton_cache_path(options)
+        if use_cache and _skeleton_is_fresh(cache_path) and not (os.path.isdir(self.app_dir) and os.listdir(self.app_dir)):
+            self.progress("Restoring cached Next.js application skeleton...")
+            await asyncio.to_thread(self._restore_skeleton, cache_path)
+            self._skeleton_restored = True
+            self.progress("Next.js application created successfully!")
+            return
+        
         # Build the command for creating a Next.js app
-        cmd_parts = ["npx", "create-next-app@latest", self.app_dir]
+        cmd_parts = [self._find_npx(), "create-next-app@latest", self.app_dir]
         
         # Add options
         if options.get('typescript', True):
@@ -128,30 +410,26 @@ class NextJSExporter:
         # Create the Next.js app
         self.progress(f"Running command: {' '.join(cmd_parts)}")
         
-        # Determine if we're on Windows
-        is_windows = platform.system() == 'Windows'
-        
         try:
-            # Use shell=True on Windows to ensure npx is found
-            process = subprocess.Popen(
-                ' '.join(cmd_parts) if is_windows else cmd_parts,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                shell=is_windows
+            # Arguments are passed as a list, so no shell is needed on Windows
+            # either; stdin is closed so npx never waits on it
+            process = await asyncio.create_subprocess_exec(
+                *cmd_parts,
+                stdin=asyncio.subprocess.DEVNULL,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE
             )
             
-            # Monitor the process
-            while True:
-                output = process.stdout.readline()
-                if not output and process.poll() is not None:
-                    break
-                if output:
-                    self.progress(output.decode('utf-8').strip())
+            # Monitor the process; both pipes are drained together so a
+            # chatty stderr can never fill up and stall npx
+            await asyncio.gather(
+                _drain_lines(process.stdout, self.progress),
+                _drain_lines(process.stderr, self.progress)
+            )
+            await process.wait()
             
-            # Check for errors
+            # Check for errors (stderr has already been reported above)
             if process.returncode != 0:
-                error = process.stderr.read().decode('utf-8')
-                self.progress(f"Error creating Next.js app: {error}")
                 raise Exception(f"create-next-app failed with code {process.returncode}")
             
             self.progress("Next.js application created successfully!")
@@ -160,29 +438,53 @@ class NextJSExporter:
             logger.error(f"Error creating Next.js app: {e}")
             self.progress(f"Error creating Next.js app: {str(e)}")
             raise
+        
+        if use_cache:
+            await asyncio.to_thread(self._store_skeleton, cache_path)
+    
+    def _restore_skeleton(self, cache_path: str):
+        """Unpack a cached create-next-app skeleton into the app directory"""
+        with tarfile.open(cache_path, 'r') as tar:
+            tar.extractall(self.app_dir, filter='tar')
+    
+    def _store_skeleton(self, cache_path: str):
+        """Archive the freshly created app so later exports can skip create-next-app"""
+        tmp_path = cache_path + '.tmp'
+        try:
+            os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+            with tarfile.open(tmp_path, 'w') as tar:
+                tar.add(self.app_dir, arcname='.')
+            os.replace(tmp_path, cache_path)
+        except Exception as e:
+            # The cache is only an optimization, so never fail the export over it
+            logger.warning(f"Could not cache Next.js skeleton: {e}")
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+    
+    @classmethod
+    def _find_npx(cls) -> str:
+        """Locate the npx executable once (npx.cmd on Windows) and cache it"""
+        if cls._npx_path is None:
+            npx_path = shutil.which('npx')
+            if npx_path is None:
+                raise FileNotFoundError("npx was not found on PATH; install Node.js to create a Next.js app")
+            cls._npx_path = npx_path
+        return cls._npx_path
     
     def _scan_dependencies(self):
         """Scan components for dependencies"""
-        self.progress("Scanning components for dependencies...")
+        self._report("Scanning components for dependencies...")
         
-        for component in self.components:
-            deps = component.get_dependencies()
-            self.all_dependencies.update(deps)
-            
-        self.progress(f"Found dependencies: {', '.join(self.all_dependencies) if self.all_dependencies else 'none'}")
+        # Dependencies are cached on each component against its content
+        # hash, so repeated exports of unchanged components skip the rescan;
+        # components never opened are streamed instead of being loaded
+        self.all_dependencies = set().union(*(component.dependencies() for component in self.components))
+        
+        self._report(f"Found dependencies: {', '.join(self.all_dependencies) if self.all_dependencies else 'none'}")
     
     def _copy_components(self, options: Dict[str, Any]):
         """Copy components to the app directory"""
-        self.progress("Copying components...")
-        
-        # Determine the components directory based on project structure
-        if options.get('router') == 'app':
-            components_dir = os.path.join(self.app_dir, "components")
-        else:
-            components_dir = os.path.join(self.app_dir, "components")
-        
-        # Create directory if it doesn't exist
-        os.makedirs(components_dir, exist_ok=True)
+        self._report("Copying components...")
         
         self.component_data = []
         extension = ".tsx" if options.get('typescript', True) else ".jsx"
@@ -192,24 +494,30 @@ class NextJSExporter:
             camel_case_name = self._to_camel_case(component.name)
             
             # Create the file path
-            file_path = os.path.join(components_dir, f"{camel_case_name}{extension}")
+            file_path = f"{self._components_prefix}{camel_case_name}{extension}"
             
-            # Write the component content
-            with open(file_path, 'w', encoding='utf-8') as f:
-                f.write(component.content)
+            if component.is_loaded:
+                # The in-memory content may hold unsaved edits, so write that
+                self._queue_write(file_path, component.content)
+            else:
+                # Never opened, so the file on disk is current; let the
+                # kernel copy it instead of reading and re-encoding it
+                self._queue_copy(component.filepath, file_path)
             
             # Store component info
             self.component_data.append({
                 "originalName": component.name,
                 "camelCaseName": camel_case_name,
-                "filePath": file_path
+                "filePath": file_path,
+                # Route segment, lowered once for every router and index page
+                "lowerName": component.name.lower()
             })
             
-            self.progress(f"Added component: {component.name}")
+            self._report(f"Added component: {component.name}")
     
     def _create_routes(self, options: Dict[str, Any]):
         """Create routes for the components"""
-        self.progress("Creating routes...")
+        self._report("Creating routes...")
         
         # Handle different router types
         if options.get('router') == 'app':
@@ -221,21 +529,16 @@ class NextJSExporter:
         """Create routes using the App Router"""
         extension = ".tsx" if options.get('typescript', True) else ".jsx"
         
-        # Create the app directory if it doesn't exist
-        app_dir = os.path.join(self.app_dir, "app")
-        os.makedirs(app_dir, exist_ok=True)
+        # Every route is <app>/<name>/page.tsx, so only the name varies
+        page_suffix = f"{os.sep}page{extension}"
         
         # Create a route for each component
         for component_info in self.component_data:
-            route_dir = os.path.join(app_dir, component_info["originalName"].lower())
-            os.makedirs(route_dir, exist_ok=True)
-            
             # Create page.tsx file
             page_content = self._create_component_page_content(component_info, options, True)
-            page_path = os.path.join(route_dir, f"page{extension}")
+            page_path = f"{self._app_router_prefix}{component_info['lowerName']}{page_suffix}"
             
-            with open(page_path, 'w', encoding='utf-8') as f:
-                f.write(page_content)
+            self._queue_write(page_path, page_content)
         
         # Update the main page to list all components
         self._create_app_index_page(options)
@@ -244,161 +547,70 @@ class NextJSExporter:
         """Create routes using the Pages Router"""
         extension = ".tsx" if options.get('typescript', True) else ".jsx"
         
-        # Create the pages directory if it doesn't exist
-        pages_dir = os.path.join(self.app_dir, "pages")
-        os.makedirs(pages_dir, exist_ok=True)
-        
         # Create a page for each component
         for component_info in self.component_data:
             page_content = self._create_component_page_content(component_info, options, False)
-            page_path = os.path.join(pages_dir, f"{component_info['originalName'].toLowerCase()}{extension}")
+            page_path = f"{self._pages_prefix}{component_info['lowerName']}{extension}"
             
-            with open(page_path, 'w', encoding='utf-8') as f:
-                f.write(page_content)
+            self._queue_write(page_path, page_content)
         
         # Update the index page to list all components
         self._create_pages_index_page(options)
     
-    def _create_component_page_content(self, component_info, options, is_app_router):
-        """Create the content for a component page"""
+    def _create_component_page_content(self, component_info, options, is_app_router) -> List[bytes]:
+        """Create the content for a component page, as chunks ready to be written"""
         # Different imports for App Router vs Pages Router
-        use_typescript = options.get('typescript', True)
+        segments = _APP_COMPONENT_PAGE_SEGMENTS if is_app_router else _PAGES_COMPONENT_PAGE_SEGMENTS
         
-        if is_app_router:
-            imports = [
-                f"import {component_info['camelCaseName']} from '@/components/{component_info['camelCaseName']}'",
-                "import Link from 'next/link'"
-            ]
-            
-            # TypeScript type for app router
-            ts_type = "export default function Page()" if use_typescript else "export default function Page()"
-            
-        else:
-            imports = [
-                f"import {component_info['camelCaseName']} from '../components/{component_info['camelCaseName']}'",
-                "import Link from 'next/link'",
-                "import Head from 'next/head'"
-            ]
-            
-            # TypeScript type for pages router
-            ts_type = "export default function ComponentPage()" if use_typescript else "export default function ComponentPage()"
-        
-        # Create the page content
-        page_content = f"""
-{chr(10).join(imports)}
-
-{ts_type} {{
-  return (
-    <div className="container mx-auto px-4 py-8">
-      <Link href="/" className="text-blue-500 hover:underline mb-4 inline-block">
-        ← Back to all components
-      </Link>
-      
-      <h1 className="text-3xl font-bold mb-6">{component_info['originalName']}</h1>
-      
-      <div className="border border-gray-300 rounded-lg p-6 bg-white">
-        <{component_info['camelCaseName']} />
-      </div>
-    </div>
-  )
-}}
-"""
-        
-        return page_content
+        # Only the names are encoded; the surrounding page text is pre-encoded
+        return _render_segments(segments, {
+            "ComponentName": component_info['camelCaseName'].encode('utf-8'),
+            "OriginalName": component_info['originalName'].encode('utf-8'),
+        })
     
     def _create_app_index_page(self, options):
         """Create the index page for App Router"""
         extension = ".tsx" if options.get('typescript', True) else ".jsx"
         
-        # Get the list of components
-        component_links = []
-        for component_info in self.component_data:
-            component_links.append(
-                f'<li key="{component_info["originalName"]}" className="mb-2">\n'
-                f'  <Link href="/{component_info["originalName"].lower()}" '
-                f'className="text-blue-500 hover:underline">\n'
-                f'    {component_info["originalName"]}\n'
-                f'  </Link>\n'
-                f'</li>'
-            )
+        # Join the links straight into one string; the page around them is
+        # pre-encoded, so the full page text is never built
+        component_links = "\n".join(
+            _APP_INDEX_LINK.format(component_info["originalName"], component_info["lowerName"])
+            for component_info in self.component_data
+        )
         
         # Create the page content
-        index_content = f"""
-import Link from 'next/link'
-
-export default function Home() {{
-  return (
-    <div className="container mx-auto px-4 py-8">
-      <h1 className="text-3xl font-bold mb-6">Component Gallery</h1>
-      
-      <div className="bg-white p-6 rounded-lg shadow-md">
-        <h2 className="text-xl font-semibold mb-4">Available Components</h2>
+        index_content = _render_segments(_APP_INDEX_PAGE_SEGMENTS, {
+            "ComponentLinks": component_links.encode('utf-8'),
+        })
         
-        <ul className="list-disc pl-6">
-          {chr(10).join(component_links)}
-        </ul>
-      </div>
-    </div>
-  )
-}}
-"""
-        
-        # Write to file
-        page_path = os.path.join(self.app_dir, "app", f"page{extension}")
-        with open(page_path, 'w', encoding='utf-8') as f:
-            f.write(index_content)
+        # Queue the file
+        page_path = f"{self._app_router_prefix}page{extension}"
+        self._queue_write(page_path, index_content)
     
     def _create_pages_index_page(self, options):
         """Create the index page for Pages Router"""
         extension = ".tsx" if options.get('typescript', True) else ".jsx"
         
-        # Get the list of components
-        component_links = []
-        for component_info in self.component_data:
-            component_links.append(
-                f'<li key="{component_info["originalName"]}" className="mb-2">\n'
-                f'  <Link href="/{component_info["originalName"].toLowerCase()}">\n'
-                f'    <a className="text-blue-500 hover:underline">{component_info["originalName"]}</a>\n'
-                f'  </Link>\n'
-                f'</li>'
-            )
+        # Join the links straight into one string; the page around them is
+        # pre-encoded, so the full page text is never built
+        component_links = "\n".join(
+            _PAGES_INDEX_LINK.format(component_info["originalName"], component_info["lowerName"])
+            for component_info in self.component_data
+        )
         
         # Create the page content
-        index_content = f"""
-import Head from 'next/head'
-import Link from 'next/link'
-
-export default function Home() {{
-  return (
-    <div className="container mx-auto px-4 py-8">
-      <Head>
-        <title>Component Gallery</title>
-        <meta name="description" content="Gallery of components" />
-        <link rel="icon" href="/favicon.ico" />
-      </Head>
-
-      <h1 className="text-3xl font-bold mb-6">Component Gallery</h1>
-      
-      <div className="bg-white p-6 rounded-lg shadow-md">
-        <h2 className="text-xl font-semibold mb-4">Available Components</h2>
-        
-        <ul className="list-disc pl-6">
-          {chr(10).join(component_links)}
-        </ul>
-      </div>
-    </div>
-  )
-}}
-"""
+        index_content = _render_segments(_PAGES_INDEX_PAGE_SEGMENTS, {
+            "ComponentLinks": component_links.encode('utf-8'),
+        })
         
-        # Write to file
-        page_path = os.path.join(self.app_dir, "pages", f"index{extension}")
-        with open(page_path, 'w', encoding='utf-8') as f:
-            f.write(index_content)
+        # Queue the file
+        page_path = f"{self._pages_prefix}index{extension}"
+        self._queue_write(page_path, index_content)
     
     def _create_layout_files(self, options):
         """Create layout files for the application"""
-        self.progress("Creating layout files...")
+        self._report("Creating layout files...")
         
         # Only needed for App Router
         if options.get('router') == 'app':
@@ -427,77 +639,76 @@ export default function RootLayout({
 }
 """
             
-            # Write to file
-            layout_path = os.path.join(self.app_dir, "app", f"layout{extension}")
-            with open(layout_path, 'w', encoding='utf-8') as f:
-                f.write(layout_content)
+            # Queue the file
+            layout_path = f"{self._app_router_prefix}layout{extension}"
+            self._queue_write(layout_path, layout_content)
+    
+    def _queue_write(self, path: str, content: Union[str, bytes, List[bytes]]) -> None:
+        """Queue a file (text, bytes or pre-encoded chunks) for the next _flush_writes call"""
+        if isinstance(content, str):
+            content = content.encode('utf-8')
+        if isinstance(content, bytes):
+            content = [content]
+        self._pending_writes.append((path, content))
+    
+    def _queue_copy(self, source: str, path: str) -> None:
+        """Queue a file to be copied verbatim by the next _flush_writes call"""
+        self._pending_copies.append((source, path))
+    
+    def _flush_writes(self) -> None:
+        """Write all queued files and empty the queue"""
+        pending, self._pending_writes = self._pending_writes, []
+        copies, self._pending_copies = self._pending_copies, []
+        _write_files(pending, copies)
     
     def _update_package_json(self, options):
         """Update package.json with additional dependencies"""
-        self.progress("Updating package.json...")
+        self._report("Updating package.json...")
         
         # Read existing package.json
-        package_json_path = os.path.join(self.app_dir, "package.json")
-        with open(package_json_path, 'r', encoding='utf-8') as f:
-            package_data = json.load(f)
-        
-        # Add component dependencies
-        for dep in self.all_dependencies:
-            if dep not in package_data.get('dependencies', {}):
-                package_data.setdefault('dependencies', {})[dep] = "latest"
-                self.progress(f"Added dependency: {dep}")
-        
-        # Write updated package.json
-        with open(package_json_path, 'w', encoding='utf-8') as f:
-            json.dump(package_data, f, indent=2)
+        package_json_path = f"{self._app_prefix}package.json"
+        with open(package_json_path, 'rb') as f:
+            package_data = load_json(f.read())
+        
+        # create-next-app names the package after the directory it created,
+        # which for a cached skeleton is not this one
+        if self._skeleton_restored:
+            package_data['name'] = os.path.basename(self.app_dir)
+        
+        # Add component dependencies that create-next-app did not already add
+        missing = self.all_dependencies.difference(package_data.get('dependencies', {}))
+        if missing:
+            dependencies = package_data.setdefault('dependencies', {})
+            for dep in missing:
+                dependencies[dep] = "latest"
+                self._report(f"Added dependency: {dep}")
+        
+        # Write updated package.json (this runs alongside the batch flush)
+        write_chunks(package_json_path, [dump_json(package_data)])
     
     def _create_readme(self):
         """Create a README.md file"""
         component_names = [comp["originalName"] for comp in self.component_data]
         
-        readme = f"""# Next.js Component Gallery
-
-A gallery of React components built with Next.js.
-
-## Included Components
-
-{chr(10).join(f"- {name}" for name in component_names)}
-
-## Getting Started
-
-1. Install dependencies:
-   ```
-   npm install
-   ```
-
-2. Start the development server:
-   ```
-   npm run dev
-   ```
-
-3. Open [http://localhost:3000](http://localhost:3000) to view the application.
-
-## Available Scripts
-
-- `npm run dev` - Runs the app in development mode
-- `npm run build` - Builds the app for production
-- `npm start` - Runs the built app in production mode
-- `npm run lint` - Lints the codebase
-"""
+        # One join builds the whole bullet list; the rest of the file is pre-encoded
+        component_list = ("- " + "\n- ".join(component_names)) if component_names else ""
+        readme = _render_segments(_README_SEGMENTS, {"ComponentList": component_list.encode('utf-8')})
         
-        with open(os.path.join(self.app_dir, "README.md"), 'w', encoding='utf-8') as f:
-            f.write(readme)
+        self._queue_write(f"{self._app_prefix}README.md", readme)
     
-    def _to_camel_case(self, name: str) -> str:
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _to_camel_case(name: str) -> str:
         """Convert a string to camelCase for component names"""
-        # Replace hyphens and underscores with spaces
+        # Replace hyphens and underscores with spaces (measured ahead of a
+        # compiled re.split for names this short)
         s = name.replace('-', ' ').replace('_', ' ')
         # Title case each word and join without spaces
         words = s.split()
         if not words:
             return ''
         # First word lowercase, rest capitalized
-        return words[0].lower() + ''.join(word.capitalize() for word in words[1:])
+        return words[0].lower() + ''.join(map(str.capitalize, words[1:]))
 
 
 # Helper function to be called from the main application
@@ -515,4 +726,4 @@ def export_nextjs_app(components, progress_callback, export_dir, options=None):
         Path to the exported application
     """
     exporter = NextJSExporter(components, progress_callback)
-    return exporter.export(export_dir, options)
\ No newline at end of file
+    return asyncio.run(exporter.export(export_dir, options))
\ No newline at end of file
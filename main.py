@@ -3,11 +3,20 @@
 TSX Component Manager - A tool for managing and exporting React TSX components
 """
 import os
+import atexit
+import functools
+import importlib.util
+import json
+import shutil
 import subprocess
 import sys
-import tkinter as tk
 import logging
-from ui.main_window import TSXComponentManager
+import logging.handlers
+import queue
+from typing import List, Optional, Tuple
+
+# Node.js/npm versions from the last check, keyed by the executables they came from
+NODE_VERSIONS_FILE = os.path.join(os.path.expanduser("~"), ".tsx_component_manager", "node_versions.json")
 
 def setup_logging():
     """Set up logging for the application"""
@@ -16,30 +25,109 @@ def setup_logging():
     
     log_file = os.path.join(log_dir, "app.log")
     
-    logging.basicConfig(
-        level=logging.INFO,
-        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-        handlers=[
-            logging.FileHandler(log_file),
-            logging.StreamHandler()
-        ]
-    )
+    # The file and console handlers run on a listener thread; loggers only
+    # enqueue records, so logging from the export path never blocks on I/O
+    formatter = logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+    file_handler = logging.FileHandler(log_file, delay=True)
+    file_handler.setFormatter(formatter)
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(formatter)
+    
+    log_queue = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(
+        log_queue, file_handler, stream_handler, respect_handler_level=True)
+    listener.start()
+    # Flush whatever is still queued when the application exits
+    atexit.register(listener.stop)
+    
+    root_logger = logging.getLogger()
+    root_logger.setLevel(logging.INFO)
+    root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
     
     logger = logging.getLogger("TSXComponentManager")
     return logger
 
 def check_dependencies():
     """Check if required dependencies are installed"""
-    try:
-        import tkinter.font as tkfont
-        import tkinter.scrolledtext as scrolledtext
-        import tkinter.ttk as ttk
-        import json
-        import subprocess
-        return True
-    except ImportError as e:
-        print(f"Missing dependency: {e}")
+    # Locate Tk without importing it, so it is only loaded once the checks pass;
+    # find_spec on a submodule such as tkinter.ttk would import the package
+    missing = [name for name in ("tkinter", "_tkinter") if importlib.util.find_spec(name) is None]
+    if missing:
+        print(f"Missing dependency: {', '.join(missing)}")
         return False
+    return True
+
+# Prints `node --version` and `npm --version` output from a single node process,
+# reading npm's version from the package.json paths passed as arguments when one
+# of them belongs to npm, and asking the npm on PATH otherwise
+_NODE_VERSIONS_SCRIPT = (
+    "let npm;"
+    "for (const file of process.argv.slice(1)) {"
+    " try { const pkg = require(file); if (pkg.name === 'npm') { npm = pkg.version; break; } } catch (e) {} }"
+    "if (!npm) npm = require('child_process').execSync('npm -v').toString().trim();"
+    "process.stdout.write(process.version + '\\n' + npm + '\\n');"
+)
+
+def _npm_package_json_paths(npm_path: str) -> List[str]:
+    """Where the package.json of the npm at npm_path can live"""
+    return [
+        # Unix: npm is a symlink to <npm>/bin/npm-cli.js
+        os.path.join(os.path.dirname(os.path.dirname(os.path.realpath(npm_path))), "package.json"),
+        # Windows: npm.cmd is a shim next to node_modules/npm
+        os.path.join(os.path.dirname(npm_path), "node_modules", "npm", "package.json"),
+    ]
+
+def _tool_stamp(path: Optional[str]) -> Optional[List[float]]:
+    """Identify an installed executable by its modification time and size"""
+    if path is None:
+        return None
+    stat = os.stat(path)
+    return [stat.st_mtime, stat.st_size]
+
+@functools.cache
+def check_node_dependencies() -> Tuple[str, str]:
+    """
+    Get the installed Node.js and npm versions
+    
+    The versions are cached in NODE_VERSIONS_FILE together with the paths and
+    modification times of the node and npm executables, so the version check
+    only runs again after Node.js is installed, upgraded or moved.
+    
+    Returns:
+        Tuple of (node version, npm version)
+    """
+    node_path = shutil.which("node")
+    npm_path = shutil.which("npm")
+    # The exporters run the npm on PATH, so it has to exist and be the one reported
+    if node_path is None or npm_path is None:
+        raise FileNotFoundError(f"{'node' if node_path is None else 'npm'} was not found on PATH")
+    key = {
+        "node": [node_path, _tool_stamp(node_path)],
+        "npm": [npm_path, _tool_stamp(npm_path)],
+    }
+    
+    try:
+        with open(NODE_VERSIONS_FILE, 'r', encoding='utf-8') as f:
+            cached = json.load(f)
+        if cached.get("key") == key:
+            return cached["node_version"], cached["npm_version"]
+    except (OSError, ValueError, KeyError, AttributeError):
+        pass
+    
+    # node is a real executable on every platform, so no shell is needed
+    output = subprocess.check_output(
+        ["node", "-e", _NODE_VERSIONS_SCRIPT, *_npm_package_json_paths(npm_path)], timeout=10).decode()
+    node_version, npm_version = (line.strip() for line in output.splitlines())
+    
+    try:
+        os.makedirs(os.path.dirname(NODE_VERSIONS_FILE), exist_ok=True)
+        with open(NODE_VERSIONS_FILE, 'w', encoding='utf-8') as f:
+            json.dump({"key": key, "node_version": node_version, "npm_version": npm_version}, f)
+    except OSError:
+        # The cache is only an optimization
+        pass
+    
+    return node_version, npm_version
 
 def main():
     """Main entry point for the application"""
@@ -52,13 +140,9 @@ def main():
         sys.exit(1)
     
     # Check for Node.js
+    is_windows = os.name == 'nt'
     try:
-        is_windows = os.name == 'nt'
-        node_cmd = "node --version" if is_windows else ["node", "--version"]
-        npm_cmd = "npm --version" if is_windows else ["npm", "--version"]
-        
-        node_version = subprocess.check_output(node_cmd, shell=is_windows).decode().strip()
-        npm_version = subprocess.check_output(npm_cmd, shell=is_windows).decode().strip()
+        node_version, npm_version = check_node_dependencies()
         
         logger.info(f"Node.js version: {node_version}")
         logger.info(f"npm version: {npm_version}")
@@ -68,6 +152,11 @@ def main():
         print("Please install Node.js from https://nodejs.org/")
         sys.exit(1)
     
+    # Only load Tk and the window modules once the checks have passed, so a
+    # failed check exits without paying for the UI imports
+    import tkinter as tk
+    from ui.main_window import TSXComponentManager
+    
     # Start the application
     root = tk.Tk()
     root.title("TSX Component Manager")
@@ -4,6 +4,7 @@ import os
 import subprocess
 import sys
 import threading
+import queue
 import json
 import time
 import webbrowser
@@ -11,8 +12,286 @@ import tempfile
 import shutil
 import socket
 import re
+import hashlib
 from pathlib import Path
 
+# tree-sitter gives exact import sources when installed; otherwise the
+# regular expression below is used
+try:
+    from tree_sitter_languages import get_parser as _get_tree_sitter_parser
+except ImportError:
+    _get_tree_sitter_parser = None
+
+# Captures the module specifier of static imports and re-exports, including
+# side-effect imports and specifier lists spanning several lines (group 1),
+# and of dynamic import() calls (group 2). Static forms must start a statement
+# so prose such as "export your data from 'Excel'" in JSX text is not matched
+_IMPORT_RE = re.compile(
+    r"""^\s*(?:import|export)\b\s*(?:[\w$*{},\s]+?\s*from\s*)?['"]([^'"\n]+)['"]"""
+    r"""|\bimport\s*\(\s*['"]([^'"\n]+)['"]\s*\)""",
+    re.MULTILINE
+)
+
+# Icon names that suggest a component uses lucide-react, as one alternation
+_LUCIDE_ICON_RE = re.compile(r'\b(?:Server|Database|Globe|Users|Network|Shield|Activity)\b')
+
+# npm install runs quietly: only errors on stderr and a JSON summary on stdout
+_NPM_INSTALL_FLAGS = (
+    '--no-audit', '--no-fund', '--prefer-offline', '--no-progress', '--loglevel=error', '--json'
+)
+
+# pnpm links packages from its global store instead of unpacking them per project
+_PNPM_INSTALL_FLAGS = ('--prefer-offline', '--loglevel=error')
+
+def _scaffold_cache_root():
+    """Return the per-user cache directory that holds scaffolded npm projects"""
+    if os.name == 'nt':
+        base = os.environ.get('LOCALAPPDATA') or os.path.expanduser('~')
+    else:
+        base = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(base, 'tsx-renderer')
+
+# webpack.config.js for the full React/Tailwind project; ${Port} is the dev server port
+_RENDERER_WEBPACK_CONFIG = r"""
+const path = require('path');
+const HtmlWebpackPlugin = require('html-webpack-plugin');
+
+module.exports = {
+  entry: './src/index.tsx',
+  output: {
+    path: path.resolve(__dirname, 'dist'),
+    filename: 'bundle.js',
+  },
+  // Keep compiled modules on disk so rebuilds only redo changed files
+  cache: {
+    type: 'filesystem',
+    cacheDirectory: path.resolve(__dirname, '.webpack-cache'),
+    buildDependencies: {
+      config: [__filename],
+    },
+  },
+  snapshot: {
+    managedPaths: [path.resolve(__dirname, 'node_modules')],
+  },
+  resolve: {
+    extensions: ['.tsx', '.ts', '.js', '.jsx'],
+  },
+  module: {
+    rules: [
+      {
+        test: /\.(ts|tsx|js|jsx)$/,
+        exclude: /node_modules/,
+        loader: 'esbuild-loader',
+        options: {
+          loader: 'tsx',
+          target: 'es2020'
+        }
+      },
+      {
+        test: /\.css$/,
+        use: ['style-loader', 'css-loader', 'postcss-loader']
+      }
+    ]
+  },
+  plugins: [
+    new HtmlWebpackPlugin({
+      template: './public/index.html'
+    })
+  ],
+  devServer: {
+    static: {
+      directory: path.join(__dirname, 'public'),
+    },
+    port: ${Port},
+    hot: true,
+    open: false
+  }
+};
+"""
+
+# postcss.config.js for Tailwind
+_RENDERER_POSTCSS_CONFIG = """
+module.exports = {
+  plugins: {
+    tailwindcss: {},
+    autoprefixer: {},
+  }
+}
+"""
+
+# tailwind.config.js
+_RENDERER_TAILWIND_CONFIG = """
+/** @type {import('tailwindcss').Config} */
+module.exports = {
+  content: [
+    "./src/**/*.{js,jsx,ts,tsx}",
+    "./public/index.html"
+  ],
+  theme: {
+    extend: {},
+  },
+  plugins: [],
+}
+"""
+
+# tsconfig.json
+_RENDERER_TSCONFIG = """
+{
+  "compilerOptions": {
+    "target": "es5",
+    "lib": ["dom", "dom.iterable", "esnext"],
+    "allowJs": true,
+    "skipLibCheck": true,
+    "esModuleInterop": true,
+    "allowSyntheticDefaultImports": true,
+    "strict": true,
+    "forceConsistentCasingInFileNames": true,
+    "module": "esnext",
+    "moduleResolution": "node",
+    "resolveJsonModule": true,
+    "isolatedModules": true,
+    "noEmit": true,
+    "jsx": "react-jsx"
+  },
+  "include": ["src"]
+}
+"""
+
+# public/index.html
+_RENDERER_INDEX_HTML = """
+<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>TSX Component Renderer</title>
+</head>
+<body>
+    <div id="root"></div>
+</body>
+</html>
+"""
+
+# src/index.css with Tailwind directives
+_RENDERER_INDEX_CSS = """
+@tailwind base;
+@tailwind components;
+@tailwind utilities;
+"""
+
+# src/index.tsx
+_RENDERER_INDEX_TSX = """
+import React from 'react';
+import ReactDOM from 'react-dom/client';
+import './index.css';
+import App from './App';
+
+const root = ReactDOM.createRoot(document.getElementById('root') as HTMLElement);
+root.render(
+  <React.StrictMode>
+    <App />
+  </React.StrictMode>
+);
+"""
+
+# Initial src/App.tsx
+_RENDERER_APP_TSX = """
+import React from 'react';
+
+const App: React.FC = () => {
+  return (
+    <div className="p-6">
+      <h1 className="text-2xl font-bold text-center mb-6">TSX Component Renderer</h1>
+      <p className="text-center">Select a TSX file to render it.</p>
+    </div>
+  );
+};
+
+export default App;
+"""
+
+# Minimal webpack.config.js focused on serving static files; ${Port} is the dev server port
+_VIEWER_WEBPACK_CONFIG = """
+    const path = require('path');
+    const HtmlWebpackPlugin = require('html-webpack-plugin');
+
+    module.exports = {
+    mode: 'development',
+    entry: './src/index.js',
+    output: {
+        path: path.resolve(__dirname, 'dist'),
+        filename: 'bundle.js',
+    },
+    // Keep compiled modules on disk so rebuilds only redo changed files
+    cache: {
+        type: 'filesystem',
+        cacheDirectory: path.resolve(__dirname, '.webpack-cache'),
+        buildDependencies: {
+        config: [__filename],
+        },
+    },
+    snapshot: {
+        managedPaths: [path.resolve(__dirname, 'node_modules')],
+    },
+    devServer: {
+        static: {
+        directory: path.join(__dirname, 'public'),
+        },
+        port: ${Port},
+        hot: false,
+        open: false
+    }
+    };
+    """
+
+# Minimal src/index.js
+_VIEWER_INDEX_JS = "console.log('Static file server started');"
+
+# Minimal package.json
+_VIEWER_PACKAGE_JSON = """
+    {
+    "name": "tsx-viewer",
+    "version": "1.0.0",
+    "description": "TSX Component Viewer",
+    "main": "index.js",
+    "scripts": {
+        "start": "webpack serve"
+    },
+    "devDependencies": {
+        "html-webpack-plugin": "^5.5.0",
+        "webpack": "^5.75.0",
+        "webpack-cli": "^4.10.0",
+        "webpack-dev-server": "^4.11.1"
+    }
+    }
+    """
+
+# Welcome public/index.html
+_VIEWER_INDEX_HTML = """
+    <!DOCTYPE html>
+    <html>
+    <head>
+        <title>TSX Component Viewer</title>
+    </head>
+    <body>
+        <h1>TSX Component Viewer</h1>
+        <p>Select a TSX file to view it.</p>
+    </body>
+    </html>
+    """
+
+# The scaffold written by setup_development_environment, keyed by relative path
+_VIEWER_FILES = {
+    "webpack.config.js": _VIEWER_WEBPACK_CONFIG,
+    os.path.join("src", "index.js"): _VIEWER_INDEX_JS,
+    "package.json": _VIEWER_PACKAGE_JSON,
+    os.path.join("public", "index.html"): _VIEWER_INDEX_HTML,
+}
+
+# Digest of the scaffold templates, computed once; combined with the port it
+# names the cached scaffold directory
+_VIEWER_FILES_DIGEST = hashlib.sha256(json.dumps(_VIEWER_FILES, sort_keys=True).encode('utf-8')).digest()
+
 class TSXRenderer:
     def __init__(self, root):
         self.root = root
@@ -100,13 +379,21 @@ class TSXRenderer:
         self.status_bar.pack(side=tk.BOTTOM, fill=tk.X, pady=(10, 0))
         
         # Initialize variables
+        # Resolve npm once; on Windows it is the npm.cmd script, which can be
+        # run directly instead of through a cmd.exe shell
+        self._npm = shutil.which('npm.cmd') if os.name == 'nt' else shutil.which('npm')
+        if self._npm is None:
+            raise RuntimeError("npm was not found on PATH. Please install Node.js from https://nodejs.org/")
+        # Installs go through pnpm when it is available
+        self._pnpm = shutil.which('pnpm')
         self.server = None
         self.server_thread = None
         self.current_file = None
         self.temp_dir = None
+        self.owns_temp_dir = False  # True only for a throwaway mkdtemp directory
+        self.session_dir = None  # Per-session working files, removed on close
         self.port = 8081  # Static port instead of finding a free one
         self.webpack_ready = False
-        self.server_ready_checked = False  # Flag to check if server is ready
         self.dependencies = {
             "react": "^18.2.0",
             "react-dom": "^18.2.0",
@@ -114,11 +401,7 @@ class TSXRenderer:
             "tailwindcss": "^3.3.0"      # Add Tailwind CSS
         }
         self.dev_dependencies = {
-            "@babel/core": "^7.22.5",
-            "@babel/preset-env": "^7.22.5",
-            "@babel/preset-react": "^7.22.5",
-            "@babel/preset-typescript": "^7.22.5",
-            "babel-loader": "^9.1.2",
+            "esbuild-loader": "^4.0.0",   # Strips types without type-checking
             "html-webpack-plugin": "^5.5.3",
             "typescript": "^5.1.3",
             "webpack": "^5.88.0",
@@ -131,6 +414,20 @@ class TSXRenderer:
             "autoprefixer": "^10.4.16"    # For Tailwind
         }
         
+        # scan_imports results keyed by a digest of the scanned content, and
+        # packages known to be present in node_modules
+        self._scan_cache = {}
+        self._installed_packages = set()
+        # Serializes npm runs that add packages to the project
+        self._install_lock = threading.Lock()
+        # Contents of opened files keyed by path, with the (mtime_ns, size)
+        # they were read at
+        self._file_cache = {}
+        
+        # Created on first use when tree-sitter is available; False once it
+        # has failed to load
+        self._ts_parser = None
+        
         # Check if the port is available
         if not self.is_port_available(self.port):
             messagebox.showwarning(
@@ -160,6 +457,26 @@ class TSXRenderer:
         self.opened_components.append((filepath, component_name))
         self.add_to_console(f"Component {component_name} added to export list")
 
+    def _load(self, filepath):
+        """Read a file, reusing the cached content while its mtime and size are unchanged"""
+        st = os.stat(filepath)
+        key = (st.st_mtime_ns, st.st_size)
+        cached = self._file_cache.get(filepath)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        
+        with open(filepath, 'r', encoding='utf-8') as file:
+            content = file.read()
+        self._file_cache[filepath] = (key, content)
+        return content
+
+    def _set_code_text(self, content):
+        """Swap the code view's text in one widget update"""
+        # A single replace redraws once, where delete + insert reflowed the
+        # widget twice; the opened file is not a user modification
+        self.code_text.replace('1.0', tk.END, content)
+        self.code_text.edit_modified(False)
+
     # Modify the open_file method to call track_component
     def open_file(self):
         """Open a TSX file and render it."""
@@ -191,12 +508,10 @@ class TSXRenderer:
         
         # Read file content
         try:
-            with open(filepath, 'r', encoding='utf-8') as file:
-                content = file.read()
+            content = self._load(filepath)
             
             # Update code view
-            self.code_text.delete(1.0, tk.END)
-            self.code_text.insert(tk.END, content)
+            self._set_code_text(content)
             
             # Check for additional dependencies
             self.check_dependencies(content)
@@ -251,13 +566,39 @@ class TSXRenderer:
         self.console_text.pack(fill=tk.BOTH, expand=True)
         self.console_text.config(state=tk.DISABLED)
         
+        # Lines are queued by add_to_console (from any thread) and written to
+        # the widget in batches by _flush_console on the UI thread
+        self._console_queue = queue.Queue()
+        self.console_max_lines = 2000
+        self.root.after(50, self._flush_console)
+        
     def add_to_console(self, text):
-        """Add text to the console window"""
-        self.console_text.config(state=tk.NORMAL)
-        self.console_text.insert(tk.END, text + "\n")
-        self.console_text.see(tk.END)
-        self.console_text.config(state=tk.DISABLED)
-        self.root.update()
+        """Add text to the console window (safe to call from any thread)"""
+        self._console_queue.put(text)
+    
+    def _flush_console(self):
+        """Write queued console lines to the widget in one insert, then reschedule"""
+        batch = []
+        try:
+            while len(batch) < 500:
+                batch.append(self._console_queue.get_nowait())
+        except queue.Empty:
+            pass
+        
+        if batch:
+            self.console_text.config(state=tk.NORMAL)
+            self.console_text.insert(tk.END, "\n".join(batch) + "\n")
+            
+            # Keep only the newest console_max_lines lines so a long-running
+            # dev server cannot grow the widget (and see()) without bound
+            line_count = int(self.console_text.index('end-1c').split('.')[0])
+            if line_count > self.console_max_lines:
+                self.console_text.delete('1.0', f'{line_count - self.console_max_lines}.0')
+            
+            self.console_text.see(tk.END)
+            self.console_text.config(state=tk.DISABLED)
+        
+        self.root.after(50, self._flush_console)
 
     def setup_development_environment(self):
         """Set up the React development environment."""
@@ -265,61 +606,75 @@ class TSXRenderer:
         self.status_bar.config(text="Setting up development environment...")
         
         # Create the necessary files for a minimal React app with Tailwind
-        self.create_react_app_files()
+        self._write_project_files()
         
-        # Start the development server
-        self.start_server()
+        self.status_bar.config(text="Installing dependencies, this may take a few minutes...")
+        self.add_to_console("Installing npm dependencies...")
         
-        # Set a timeout to check server status if webpack ready flag isn't set
-        self.root.after(10000, self.check_server_startup)
+        # Install dependencies in the background, then start the development server
+        self._install_deps_async(lambda success: self.start_server())
 
-    def check_server_startup(self):
-        """Check if server has started even if we missed the signal"""
-        if not self.webpack_ready and not self.server_ready_checked:
-            self.server_ready_checked = True
-            
-            # Try to connect to the server to see if it's actually running
+    def _extract_specifiers(self, content):
+        """Return the module specifiers imported, re-exported or dynamically imported by the content"""
+        if _get_tree_sitter_parser is not None and self._ts_parser is not False:
             try:
-                with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-                    s.connect(('localhost', self.port))
-                    # If we can connect, the server is running
-                    self.webpack_ready = True
-                    self.status_bar.config(text=f"Development server running on port {self.port}")
-                    self.add_to_console("\nServer detected as running on port 8081")
-                    
-                    # Notify that server is ready
-                    messagebox.showinfo(
-                        "Server Ready", 
-                        f"Webpack server is running on port {self.port}.\n\n"
-                        f"You can open the preview in your browser with the 'Open in Browser' button."
-                    )
-            except:
-                # If we can't connect, server might not be running yet
-                self.add_to_console("\nCould not detect server running. Waiting longer...")
-                # Try again in 10 seconds
-                self.root.after(10000, self.check_server_startup)
+                if self._ts_parser is None:
+                    self._ts_parser = _get_tree_sitter_parser('tsx')
+                return self._tree_sitter_specifiers(content)
+            except Exception as e:
+                # Mismatched tree-sitter builds fail here; use the regex from now on
+                self.add_to_console(f"tree-sitter unavailable, falling back to regex import scan: {e}")
+                self._ts_parser = False
+        
+        return {static or dynamic for static, dynamic in _IMPORT_RE.findall(content)}
+
+    def _tree_sitter_specifiers(self, content):
+        """Collect import sources by walking the tree-sitter syntax tree"""
+        def string_value(node):
+            return ''.join(child.text.decode('utf-8') for child in node.named_children
+                           if child.type == 'string_fragment')
+        
+        specifiers = set()
+        stack = [self._ts_parser.parse(content.encode('utf-8')).root_node]
+        while stack:
+            node = stack.pop()
+            if node.type in ('import_statement', 'export_statement'):
+                source = node.child_by_field_name('source')
+                if source is not None:
+                    specifiers.add(string_value(source))
+            elif node.type == 'call_expression':
+                function = node.child_by_field_name('function')
+                arguments = node.child_by_field_name('arguments')
+                if function is not None and function.type == 'import' and arguments is not None:
+                    specifiers.update(string_value(arg) for arg in arguments.named_children
+                                      if arg.type == 'string')
+            stack.extend(node.named_children)
+        
+        specifiers.discard('')
+        return specifiers
 
     def scan_imports(self, content):
         """Scan the content for import statements to detect dependencies with improved detection"""
-        # Regular expression to match import statements
-        import_pattern = r"import\s+(?:{[^}]*}|\*\s+as\s+[a-zA-Z_][a-zA-Z0-9_]*|[a-zA-Z_][a-zA-Z0-9_]*)\s+from\s+['\"]([^'\"]+)['\"]"
-        matches = re.findall(import_pattern, content)
-        
-        # Filter out relative imports and React core packages
-        external_packages = []
-        for match in matches:
-            if not match.startswith('.') and match not in ['react', 'react-dom']:
-                external_packages.append(match)
+        external_packages = set()
+        for specifier in self._extract_specifiers(content):
+            # Skip relative and absolute paths
+            if specifier.startswith(('.', '/')):
+                continue
+            # Reduce deep imports to the package name: "lodash/debounce" is
+            # "lodash", "@scope/pkg/sub" is "@scope/pkg"
+            parts = specifier.split('/')
+            package = '/'.join(parts[:2]) if specifier.startswith('@') else parts[0]
+            # React core packages are always present
+            if package not in ('react', 'react-dom'):
+                external_packages.add(package)
         
         # Special handling for lucide-react which is used in many components
-        if 'lucide-react' not in external_packages and any(icon in content for icon in 
-                                                        ['Server', 'Database', 'Globe', 'Users', 
-                                                        'Network', 'Shield', 'Activity']):
-            external_packages.append('lucide-react')
+        if 'lucide-react' not in external_packages and _LUCIDE_ICON_RE.search(content):
+            external_packages.add('lucide-react')
         
-        return list(set(external_packages))  # Remove duplicates
+        return list(external_packages)
 
-    def create_react_app_files(self):
+    def _write_project_files(self):
         """Create the basic files needed for a React app with Tailwind CSS."""
         # Create package.json
         package_json = {
@@ -334,276 +689,170 @@ class TSXRenderer:
             "devDependencies": self.dev_dependencies
         }
         
-        with open(os.path.join(self.temp_dir, "package.json"), "w") as f:
-            json.dump(package_json, f, indent=2)
-        
-        # Create webpack.config.js with CSS support
-        webpack_config = r"""
-const path = require('path');
-const HtmlWebpackPlugin = require('html-webpack-plugin');
+        self._write_files({
+            "package.json": json.dumps(package_json, indent=2).encode('utf-8'),
+            "webpack.config.js": _RENDERER_WEBPACK_CONFIG.replace('${Port}', str(self.port)).encode('utf-8'),
+            "postcss.config.js": _RENDERER_POSTCSS_CONFIG.encode('utf-8'),
+            "tailwind.config.js": _RENDERER_TAILWIND_CONFIG.encode('utf-8'),
+            "tsconfig.json": _RENDERER_TSCONFIG.encode('utf-8'),
+            "public/index.html": _RENDERER_INDEX_HTML.encode('utf-8'),
+            "src/index.css": _RENDERER_INDEX_CSS.encode('utf-8'),
+            "src/index.tsx": _RENDERER_INDEX_TSX.encode('utf-8'),
+            "src/App.tsx": _RENDERER_APP_TSX.encode('utf-8'),
+        })
 
-module.exports = {
-  entry: './src/index.tsx',
-  output: {
-    path: path.resolve(__dirname, 'dist'),
-    filename: 'bundle.js',
-  },
-  resolve: {
-    extensions: ['.tsx', '.ts', '.js', '.jsx'],
-  },
-  module: {
-    rules: [
-      {
-        test: /\.(ts|tsx|js|jsx)$/,
-        exclude: /node_modules/,
-        use: {
-          loader: 'babel-loader',
-          options: {
-            presets: [
-              '@babel/preset-env',
-              '@babel/preset-react',
-              '@babel/preset-typescript'
-            ]
-          }
-        }
-      },
-      {
-        test: /\.css$/,
-        use: ['style-loader', 'css-loader', 'postcss-loader']
-      }
-    ]
-  },
-  plugins: [
-    new HtmlWebpackPlugin({
-      template: './public/index.html'
-    })
-  ],
-  devServer: {
-    static: {
-      directory: path.join(__dirname, 'public'),
-    },
-    port: """ + str(self.port) + """,
-    hot: true,
-    open: false
-  }
-};
-"""
-        
-        with open(os.path.join(self.temp_dir, "webpack.config.js"), "w") as f:
-            f.write(webpack_config)
-        
-        # Create babel.config.js
-        babel_config = """
-module.exports = {
-  presets: [
-    '@babel/preset-env',
-    '@babel/preset-react',
-    '@babel/preset-typescript'
-  ]
-};
-"""
-        
-        with open(os.path.join(self.temp_dir, "babel.config.js"), "w") as f:
-            f.write(babel_config)
-        
-        # Create postcss.config.js for Tailwind
-        postcss_config = """
-module.exports = {
-  plugins: {
-    tailwindcss: {},
-    autoprefixer: {},
-  }
-}
-"""
-        
-        with open(os.path.join(self.temp_dir, "postcss.config.js"), "w") as f:
-            f.write(postcss_config)
-        
-        # Create tailwind.config.js
-        tailwind_config = """
-/** @type {import('tailwindcss').Config} */
-module.exports = {
-  content: [
-    "./src/**/*.{js,jsx,ts,tsx}",
-    "./public/index.html"
-  ],
-  theme: {
-    extend: {},
-  },
-  plugins: [],
-}
-"""
-        
-        with open(os.path.join(self.temp_dir, "tailwind.config.js"), "w") as f:
-            f.write(tailwind_config)
-        
-        # Create tsconfig.json
-        tsconfig = """
-{
-  "compilerOptions": {
-    "target": "es5",
-    "lib": ["dom", "dom.iterable", "esnext"],
-    "allowJs": true,
-    "skipLibCheck": true,
-    "esModuleInterop": true,
-    "allowSyntheticDefaultImports": true,
-    "strict": true,
-    "forceConsistentCasingInFileNames": true,
-    "module": "esnext",
-    "moduleResolution": "node",
-    "resolveJsonModule": true,
-    "isolatedModules": true,
-    "noEmit": true,
-    "jsx": "react-jsx"
-  },
-  "include": ["src"]
-}
-"""
-        
-        with open(os.path.join(self.temp_dir, "tsconfig.json"), "w") as f:
-            f.write(tsconfig)
-        
-        # Create directory structure
-        os.makedirs(os.path.join(self.temp_dir, "src"), exist_ok=True)
-        os.makedirs(os.path.join(self.temp_dir, "public"), exist_ok=True)
-        
-        # Create public/index.html
-        index_html = """
-<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>TSX Component Renderer</title>
-</head>
-<body>
-    <div id="root"></div>
-</body>
-</html>
-"""
-        
-        with open(os.path.join(self.temp_dir, "public", "index.html"), "w") as f:
-            f.write(index_html)
-        
-        # Create src/index.css with Tailwind directives
-        index_css = """
-@tailwind base;
-@tailwind components;
-@tailwind utilities;
-"""
-        
-        with open(os.path.join(self.temp_dir, "src", "index.css"), "w") as f:
-            f.write(index_css)
-        
-        # Create src/index.tsx
-        index_tsx = """
-import React from 'react';
-import ReactDOM from 'react-dom/client';
-import './index.css';
-import App from './App';
+    def _write_files(self, files):
+        """Write a {relative path: bytes} mapping into the project directory"""
+        for relpath, data in files.items():
+            path = Path(self.temp_dir) / relpath
+            # Leave identical files untouched so their mtimes, and webpack's
+            # caches keyed on them, stay valid
+            try:
+                if path.read_bytes() == data:
+                    continue
+            except OSError:
+                path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_bytes(data)
 
-const root = ReactDOM.createRoot(document.getElementById('root') as HTMLElement);
-root.render(
-  <React.StrictMode>
-    <App />
-  </React.StrictMode>
-);
-"""
+    def _popen_npm(self, *args, stderr=subprocess.PIPE):
+        """Start npm in the project directory with line-buffered text output"""
+        return subprocess.Popen(
+            [self._npm, *args],
+            cwd=self.temp_dir,
+            stdout=subprocess.PIPE,
+            stderr=stderr,
+            text=True,
+            encoding='utf-8',
+            errors='replace',
+            bufsize=1
+        )
+
+    def _install_deps_async(self, on_complete):
+        """
+        Run npm install in the background so the Tk event loop keeps running
         
-        with open(os.path.join(self.temp_dir, "src", "index.tsx"), "w") as f:
-            f.write(index_tsx)
+        npm's errors and summary go to the console queue, and
+        on_complete(success) is called on the UI thread once npm exits.
+        """
+        def run_install():
+            success = False
+            try:
+                success = self._run_install()
+                
+                if success:
+                    status = "Dependencies installed successfully"
+                    message = status
+                else:
+                    status = "Error installing dependencies"
+                    message = "Error installing dependencies: see the npm output above"
+            except Exception as e:
+                status = f"Error installing dependencies: {e}"
+                message = f"Error installing dependencies: {str(e)}"
+            
+            def finish():
+                self.status_bar.config(text=status)
+                self.add_to_console(message)
+                on_complete(success)
+            self.root.after(0, finish)
         
-        # Create initial App.tsx
-        app_tsx = """
-import React from 'react';
+        threading.Thread(target=run_install, daemon=True).start()
 
-const App: React.FC = () => {
-  return (
-    <div className="p-6">
-      <h1 className="text-2xl font-bold text-center mb-6">TSX Component Renderer</h1>
-      <p className="text-center">Select a TSX file to render it.</p>
-    </div>
-  );
-};
+    def _install_command(self, packages):
+        """Choose the package manager command that installs the project or adds packages"""
+        if self._pnpm:
+            return [self._pnpm, "add" if packages else "install", *_PNPM_INSTALL_FLAGS, *packages]
+        # npm ci skips dependency resolution when an earlier install left a
+        # lockfile behind
+        if not packages and os.path.exists(os.path.join(self.temp_dir, "package-lock.json")):
+            return [self._npm, "ci", *_NPM_INSTALL_FLAGS]
+        return [self._npm, "install", *_NPM_INSTALL_FLAGS, *packages]
 
-export default App;
-"""
+    def _run_install(self, *packages):
+        """
+        Install the project dependencies, or add packages, and report the outcome
         
-        with open(os.path.join(self.temp_dir, "src", "App.tsx"), "w") as f:
-            f.write(app_tsx)
+        Only the package manager's errors and a one-line summary reach the
+        console, instead of every line of install output.
         
-        self.status_bar.config(text="Installing dependencies, this may take a few minutes...")
-        self.add_to_console("Installing npm dependencies...")
-        self.root.update()
+        Returns:
+            True if the install succeeded
+        """
+        command = self._install_command(packages)
+        result = self._run_quiet(command)
+        if result.returncode != 0 and command[1] == "ci":
+            # A lockfile that no longer matches package.json makes npm ci fail
+            self.add_to_console("npm ci failed, falling back to npm install")
+            result = self._run_quiet([self._npm, "install", *_NPM_INSTALL_FLAGS])
+        
+        return result.returncode == 0
+
+    def _run_quiet(self, command):
+        """Run an install command, pushing only its errors and summary to the console"""
+        result = subprocess.run(
+            command,
+            cwd=self.temp_dir,
+            capture_output=True,
+            text=True,
+            encoding='utf-8',
+            errors='replace'
+        )
+        
+        if result.stderr.strip():
+            self.add_to_console(result.stderr.strip())
         
-        # Install dependencies
         try:
-            # Use shell=True for Windows to ensure npm is found
-            is_windows = os.name == 'nt'
-            process = subprocess.Popen(
-                "npm install" if is_windows else ["npm", "install"],
-                cwd=self.temp_dir,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                shell=is_windows
-            )
-            
-            # Monitor installation progress
-            for line in process.stdout:
-                line_str = line.decode('utf-8').strip()
-                self.add_to_console(line_str)
-            
-            process.wait()
-            
-            if process.returncode == 0:
-                self.status_bar.config(text="Dependencies installed successfully")
-                self.add_to_console("Dependencies installed successfully")
-            else:
-                error_output = process.stderr.read().decode('utf-8')
-                self.status_bar.config(text="Error installing dependencies")
-                self.add_to_console(f"Error installing dependencies: {error_output}")
-                
-        except Exception as e:
-            self.status_bar.config(text=f"Error installing dependencies: {e}")
-            self.add_to_console(f"Error installing dependencies: {str(e)}")
+            summary = json.loads(result.stdout)
+        except ValueError:
+            summary = None
+        if isinstance(summary, dict):
+            if isinstance(summary.get("error"), dict):
+                self.add_to_console(f"npm error: {summary['error'].get('summary', '')}")
+            elif "added" in summary:
+                self.add_to_console(
+                    f"npm: added {summary['added']}, removed {summary.get('removed', 0)}, "
+                    f"changed {summary.get('changed', 0)} packages"
+                )
+        elif result.stdout.strip():
+            # pnpm has no JSON summary; with --loglevel=error its output is short
+            self.add_to_console(result.stdout.strip())
+        
+        return result
 
     def install_package(self, package_name):
-        """Install a specific npm package"""
-        self.status_bar.config(text=f"Installing {package_name}...")
-        self.add_to_console(f"Installing {package_name}...")
+        """Install a specific npm package (blocks until the install finishes)"""
+        with self._install_lock:
+            return self._run_install(package_name)
+
+    def _install_many_async(self, packages, on_complete):
+        """
+        Install several npm packages in the background with a single install
         
-        try:
-            # Use shell=True for Windows to ensure npm is found
-            is_windows = os.name == 'nt'
-            process = subprocess.Popen(
-                f"npm install {package_name}" if is_windows else ["npm", "install", package_name],
-                cwd=self.temp_dir,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                shell=is_windows
-            )
-            
-            # Monitor installation progress
-            for line in process.stdout:
-                line_str = line.decode('utf-8').strip()
-                self.add_to_console(line_str)
-            
-            process.wait()
+        on_complete(installed) is called on the UI thread with the packages
+        that were installed successfully.
+        """
+        names = ", ".join(packages)
+        self.status_bar.config(text=f"Installing {names}...")
+        self.add_to_console(f"Installing {names}...")
+        
+        def run_install():
+            installed = []
+            try:
+                # Installs share node_modules and the lockfile, so run one at a time
+                with self._install_lock:
+                    # One resolution pass and one lockfile write for the whole batch
+                    if self._run_install(*packages):
+                        installed = list(packages)
+                    elif len(packages) > 1:
+                        # A single unresolvable name fails the whole batch, so
+                        # retry the packages one by one
+                        self.add_to_console("Batch install failed, installing packages one at a time")
+                        installed = [package for package in packages if self._run_install(package)]
+            except Exception as e:
+                self.add_to_console(f"Error installing {names}: {str(e)}")
             
-            if process.returncode == 0:
-                self.status_bar.config(text=f"{package_name} installed successfully")
-                self.add_to_console(f"{package_name} installed successfully")
-                return True
-            else:
-                error_output = process.stderr.read().decode('utf-8')
-                self.status_bar.config(text=f"Error installing {package_name}")
-                self.add_to_console(f"Error installing {package_name}: {error_output}")
-                return False
-                
-        except Exception as e:
-            self.status_bar.config(text=f"Error installing {package_name}: {e}")
-            self.add_to_console(f"Error installing {package_name}: {str(e)}")
-            return False
+            self.root.after(0, lambda: on_complete(installed))
+        
+        threading.Thread(target=run_install, daemon=True).start()
 
     def start_server(self):
         """Start the webpack development server."""
@@ -612,48 +861,13 @@ export default App;
                 self.status_bar.config(text=f"Starting development server on port {self.port}...")
                 self.add_to_console(f"Starting webpack development server on port {self.port}...")
                 
-                # Use shell=True for Windows to ensure npm is found
-                is_windows = os.name == 'nt'
-                process = subprocess.Popen(
-                    "npm start" if is_windows else ["npm", "start"],
-                    cwd=self.temp_dir,
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.PIPE,
-                    shell=is_windows
-                )
+                process = self._popen_npm("start")
                 
-                # Process both stdout and stderr
-                while True:
-                    # Read from stdout
-                    stdout_line = process.stdout.readline()
-                    if stdout_line:
-                        line_str = stdout_line.decode('utf-8').strip()
-                        self.add_to_console(line_str)
-                        
-                        # More patterns to detect successful compilation
-                        if any(pattern in line_str.lower() for pattern in [
-                            "compiled successfully", 
-                            "webpack compiled",
-                            "on your network",
-                            "project is running at",
-                            "(name: main"
-                        ]):
-                            # Wait a bit to ensure server is fully started
-                            time.sleep(1)
-                            self.status_bar.config(text=f"Development server running on port {self.port}")
-                            # Set webpack ready flag
-                            self.webpack_ready = True
-                            # Notify that server is ready
-                            self.root.after(0, lambda: messagebox.showinfo(
-                                "Server Ready", 
-                                f"Webpack server is running on port {self.port}.\n\n"
-                                f"You can open the preview in your browser with the 'Open in Browser' button."
-                            ))
-                    
-                    # Read from stderr
-                    stderr_line = process.stderr.readline()
-                    if stderr_line:
-                        line_str = stderr_line.decode('utf-8').strip()
+                # Drain stderr on its own thread; reading both pipes from one
+                # loop left each readline blocked behind the other pipe
+                def read_stderr():
+                    for stderr_line in iter(process.stderr.readline, ''):
+                        line_str = stderr_line.strip()
                         self.add_to_console(line_str)
                         
                         # Check for address in use error
@@ -665,16 +879,23 @@ export default App;
                             ))
                         elif "error" in line_str.lower():
                             self.status_bar.config(text=f"Error in webpack: {line_str}")
-                    
-                    # Check if process is still running
-                    if process.poll() is not None:
-                        if process.returncode != 0:
-                            self.status_bar.config(text=f"Server stopped with code {process.returncode}")
-                        break
-                        
-                    # If no output, give a small pause
-                    if not stdout_line and not stderr_line:
-                        time.sleep(0.1)
+                
+                stderr_thread = threading.Thread(target=read_stderr, daemon=True)
+                stderr_thread.start()
+                
+                # Readiness comes from the port accepting connections rather
+                # than from webpack's log wording
+                threading.Thread(target=self._probe_ready, args=(process,), daemon=True).start()
+                
+                # Read stdout until the server exits
+                for stdout_line in iter(process.stdout.readline, ''):
+                    line_str = stdout_line.strip()
+                    self.add_to_console(line_str)
+                
+                stderr_thread.join()
+                process.wait()
+                if process.returncode != 0:
+                    self.status_bar.config(text=f"Server stopped with code {process.returncode}")
                         
             except Exception as e:
                 self.status_bar.config(text=f"Error starting server: {e}")
@@ -683,6 +904,31 @@ export default App;
         self.server_thread = threading.Thread(target=run_server, daemon=True)
         self.server_thread.start()
 
+    def _probe_ready(self, process, timeout=120):
+        """Poll the server port until it accepts connections, then report readiness on the UI thread"""
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline and process.poll() is None:
+            with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+                s.settimeout(0.2)
+                try:
+                    s.connect(('127.0.0.1', self.port))
+                except OSError:
+                    pass
+                else:
+                    self.root.after(0, self._on_server_ready)
+                    return
+            time.sleep(0.2)
+
+    def _on_server_ready(self):
+        """Mark the development server as running and notify the user"""
+        self.status_bar.config(text=f"Development server running on port {self.port}")
+        self.webpack_ready = True
+        messagebox.showinfo(
+            "Server Ready", 
+            f"Webpack server is running on port {self.port}.\n\n"
+            f"You can open the preview in your browser with the 'Open in Browser' button."
+        )
+
     def open_file(self):
         """Open a TSX file and render it."""
         filetypes = [
@@ -709,12 +955,10 @@ export default App;
         
         # Read file content
         try:
-            with open(filepath, 'r', encoding='utf-8') as file:
-                content = file.read()
+            content = self._load(filepath)
             
             # Update code view
-            self.code_text.delete(1.0, tk.END)
-            self.code_text.insert(tk.END, content)
+            self._set_code_text(content)
             
             # Check for additional dependencies
             self.check_dependencies(content)
@@ -727,41 +971,64 @@ export default App;
             self.add_to_console(f"Error opening file: {str(e)}")
             messagebox.showerror("Error", f"Could not open file: {str(e)}")
 
+    def is_package_installed(self, package):
+        """Check whether a package is already present in the project's node_modules"""
+        if package in self._installed_packages:
+            return True
+        # The scaffold directory is reused between runs, so packages installed
+        # in an earlier session are found here without asking again
+        if os.path.exists(os.path.join(self.temp_dir, "node_modules", package, "package.json")):
+            self._installed_packages.add(package)
+            return True
+        return False
+
     def check_dependencies(self, content):
         """Check for dependencies in the content and install if needed"""
-        packages = self.scan_imports(content)
+        # Unchanged content (e.g. reopening a file) skips the rescan
+        digest = hashlib.blake2b(content.encode('utf-8'), digest_size=16).digest()
+        packages = self._scan_cache.get(digest)
+        if packages is None:
+            packages = self.scan_imports(content)
+            self._scan_cache[digest] = packages
         
         if packages:
             self.add_to_console(f"Detected imports: {', '.join(packages)}")
             
-            # Check which packages need to be installed
+            # Essential packages are installed without asking; the rest only
+            # with the user's approval
+            essential_packages = ['lucide-react', 'tailwindcss']
+            to_install = []
             for package in packages:
-                # Skip packages that are already in dependencies
-                if package in self.dependencies:
+                # Skip packages that are already in dependencies or installed
+                if package in self.dependencies or self.is_package_installed(package):
                     continue
                 
-                # Automatically install essential packages without asking
-                essential_packages = ['lucide-react', 'tailwindcss']
                 if package in essential_packages:
                     self.add_to_console(f"Installing essential package: {package}")
-                    success = self.install_package(package)
-                    if success:
-                        # Add to dependencies list
-                        self.dependencies[package] = "latest"
-                    else:
-                        messagebox.showwarning("Warning", 
-                                            f"Failed to install {package}. Component may not render correctly.")
-                else:
-                    # Ask user if they want to install non-essential packages
-                    if messagebox.askyesno("Install Package", 
+                    to_install.append(package)
+                elif messagebox.askyesno("Install Package", 
                                         f"The component requires '{package}'. Install it?"):
-                        success = self.install_package(package)
-                        if success:
-                            # Add to dependencies list
-                            self.dependencies[package] = "latest"
-                        else:
-                            messagebox.showwarning("Warning", 
-                                                f"Failed to install {package}. Component may not render correctly.")
+                    to_install.append(package)
+            
+            def installed(done):
+                for package in done:
+                    # Add to dependencies list
+                    self.dependencies[package] = "latest"
+                    self._installed_packages.add(package)
+                
+                failed = [package for package in to_install if package not in done]
+                if failed:
+                    self.status_bar.config(text=f"Error installing {', '.join(failed)}")
+                    self.add_to_console(f"Error installing {', '.join(failed)}")
+                    messagebox.showwarning("Warning", 
+                                        f"Failed to install {', '.join(failed)}. Component may not render correctly.")
+                else:
+                    self.status_bar.config(text=f"{', '.join(done)} installed successfully")
+                    self.add_to_console(f"{', '.join(done)} installed successfully")
+            
+            if to_install:
+                # Install without blocking the UI
+                self._install_many_async(to_install, installed)
 
 # Enhanced TSX Renderer Fix (Corrected)
 # Fixed the f-string syntax error with JSX content
@@ -902,116 +1169,63 @@ export default App;
 
     def setup_development_environment(self):
         """Set up the development environment with a focus on serving static files."""
-        self.temp_dir = tempfile.mkdtemp()
         self.status_bar.config(text="Setting up minimal server environment...")
         
-        # Create the necessary directories
-        os.makedirs(os.path.join(self.temp_dir, "public"), exist_ok=True)
-        os.makedirs(os.path.join(self.temp_dir, "src"), exist_ok=True)
-        
-        # Create a minimal webpack.config.js focused on serving static files
-        webpack_config = f"""
-    const path = require('path');
-    const HtmlWebpackPlugin = require('html-webpack-plugin');
-
-    module.exports = {{
-    mode: 'development',
-    entry: './src/index.js',
-    output: {{
-        path: path.resolve(__dirname, 'dist'),
-        filename: 'bundle.js',
-    }},
-    devServer: {{
-        static: {{
-        directory: path.join(__dirname, 'public'),
-        }},
-        port: {self.port},
-        hot: false,
-        open: false
-    }}
-    }};
-    """
-        
-        with open(os.path.join(self.temp_dir, "webpack.config.js"), "w") as f:
-            f.write(webpack_config)
-        
-        # Create a minimal index.js
-        with open(os.path.join(self.temp_dir, "src", "index.js"), "w") as f:
-            f.write("console.log('Static file server started');")
-        
-        # Create minimal package.json
-        package_json = """
-    {
-    "name": "tsx-viewer",
-    "version": "1.0.0",
-    "description": "TSX Component Viewer",
-    "main": "index.js",
-    "scripts": {
-        "start": "webpack serve"
-    },
-    "devDependencies": {
-        "html-webpack-plugin": "^5.5.0",
-        "webpack": "^5.75.0",
-        "webpack-cli": "^4.10.0",
-        "webpack-dev-server": "^4.11.1"
-    }
-    }
-    """
-        
-        with open(os.path.join(self.temp_dir, "package.json"), "w") as f:
-            f.write(package_json)
+        port = str(self.port)
+        project_files = {
+            relpath: template.replace('${Port}', port) for relpath, template in _VIEWER_FILES.items()
+        }
         
-        # Create a welcome index.html
-        with open(os.path.join(self.temp_dir, "public", "index.html"), "w") as f:
-            f.write("""
-    <!DOCTYPE html>
-    <html>
-    <head>
-        <title>TSX Component Viewer</title>
-    </head>
-    <body>
-        <h1>TSX Component Viewer</h1>
-        <p>Select a TSX file to view it.</p>
-    </body>
-    </html>
-    """)
+        # The scaffold only depends on the templates and the port, so it lives
+        # in a per-user cache directory keyed by them and is reused by later
+        # runs instead of being reinstalled into a new temp directory
+        key = hashlib.sha256(_VIEWER_FILES_DIGEST + port.encode('utf-8')).hexdigest()[:16]
+        try:
+            self.temp_dir = os.path.join(_scaffold_cache_root(), key)
+            os.makedirs(self.temp_dir, exist_ok=True)
+            self.owns_temp_dir = False
+        except OSError:
+            self.temp_dir = tempfile.mkdtemp()
+            self.owns_temp_dir = True
+        
+        # Only package.json, the configs and node_modules are shared between
+        # sessions; component copies from earlier runs must not leak into this one
+        self.session_dir = tempfile.mkdtemp(prefix="tsx-renderer-")
+        self._clear_session_output()
+        
+        # Reuse the cached scaffold when its install completed for this key
+        hash_path = os.path.join(self.temp_dir, ".deps-hash")
+        node_modules = os.path.join(self.temp_dir, "node_modules")
+        if ((os.path.exists(os.path.join(node_modules, ".package-lock.json"))
+                or os.path.exists(os.path.join(node_modules, ".modules.yaml")))
+                and os.path.exists(os.path.join(self.temp_dir, "package.json"))):
+            try:
+                with open(hash_path, "r") as f:
+                    cached_key = f.read().strip()
+            except OSError:
+                cached_key = None
+            if cached_key == key:
+                self.status_bar.config(text="Using cached development environment")
+                self.add_to_console(f"Reusing cached dependencies in {self.temp_dir}")
+                self.start_server()
+                return
+        
+        self._write_files({relpath: content.encode('utf-8') for relpath, content in project_files.items()})
         
         self.status_bar.config(text="Installing minimal dependencies...")
         self.add_to_console("Installing minimal dependencies for static file server...")
         
-        # Install dependencies
-        try:
-            # Use shell=True for Windows to ensure npm is found
-            is_windows = os.name == 'nt'
-            process = subprocess.Popen(
-                "npm install" if is_windows else ["npm", "install"],
-                cwd=self.temp_dir,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                shell=is_windows
-            )
+        def installed(success):
+            if success:
+                # Mark the scaffold as complete so later runs can reuse it
+                with open(hash_path, "w") as f:
+                    f.write(key)
             
-            # Monitor installation progress
-            for line in process.stdout:
-                line_str = line.decode('utf-8').strip()
-                self.add_to_console(line_str)
-            
-            process.wait()
-            
-            if process.returncode == 0:
-                self.status_bar.config(text="Dependencies installed successfully")
-                self.add_to_console("Dependencies installed successfully")
-            else:
-                error_output = process.stderr.read().decode('utf-8')
-                self.status_bar.config(text="Error installing dependencies")
-                self.add_to_console(f"Error installing dependencies: {error_output}")
-                
-        except Exception as e:
-            self.status_bar.config(text=f"Error installing dependencies: {e}")
-            self.add_to_console(f"Error installing dependencies: {str(e)}")
+            # Start the server
+            self.start_server()
         
-        # Start the server
-        self.start_server()
+        # Install dependencies without blocking the UI
+        self._install_deps_async(installed)
 
     def refresh_webpack_server(self):
         """Refresh the webpack server to ensure changes are picked up"""
@@ -1070,14 +1284,35 @@ export default App;
         self.status_bar.config(text="Preview available in browser window")
         self.add_to_console("Preview opened in browser. If it doesn't show correctly, try refreshing after a few seconds.")
 
+    def _clear_session_output(self):
+        """Remove the served files a session writes into the shared scaffold directory"""
+        # public/ holds only the scaffold's index.html; view.html, the
+        # component download copies and the exported zip are per session
+        public_dir = os.path.join(self.temp_dir, "public")
+        try:
+            entries = os.listdir(public_dir)
+        except OSError:
+            entries = []
+        for name in entries:
+            if name != "index.html":
+                try:
+                    os.remove(os.path.join(public_dir, name))
+                except OSError:
+                    pass
+        # Exports from before react-app/ moved into the session directory
+        shutil.rmtree(os.path.join(self.temp_dir, "react-app"), ignore_errors=True)
+
     def on_close(self):
         """Clean up before closing the application."""
-        # Clean up temporary directory
+        # Clean up the temporary directory (the cached scaffold is kept, minus
+        # this session's output)
         if self.temp_dir and os.path.exists(self.temp_dir):
-            try:
-                shutil.rmtree(self.temp_dir)
-            except:
-                pass
+            if self.owns_temp_dir:
+                shutil.rmtree(self.temp_dir, ignore_errors=True)
+            else:
+                self._clear_session_output()
+        if self.session_dir:
+            shutil.rmtree(self.session_dir, ignore_errors=True)
         
         # Close the application
         self.root.destroy()
@@ -1098,8 +1333,10 @@ export default App;
         self.add_to_console("Creating React application for components...")
         
         try:
-            # Create a temporary directory for the React app
-            react_app_dir = os.path.join(self.temp_dir, "react-app")
+            # Create a temporary directory for the React app; it is rebuilt on
+            # every export so only the given components end up in the zip
+            react_app_dir = os.path.join(self.session_dir, "react-app")
+            shutil.rmtree(react_app_dir, ignore_errors=True)
             os.makedirs(react_app_dir, exist_ok=True)
             
             # Create basic project structure
@@ -134,10 +134,10 @@ class ComponentListFrame(ttk.LabelFrame):
         for filepath in filepaths:
             try:
                 # Check if file already added
-                for component in self.component_manager.components:
-                    if os.path.samefile(component.filepath, filepath):
-                        self.app.log(f"Component {component.name} is already in the list")
-                        continue
+                existing = self.component_manager.get_component_by_path(filepath)
+                if existing is not None:
+                    self.app.log(f"Component {existing.name} is already in the list")
+                    continue
                 
                 # Add the component
                 component = self.component_manager.add_component(filepath)
@@ -217,7 +217,7 @@ class ComponentListFrame(ttk.LabelFrame):
         
         try:
             # Rename the component (this updates both file and internal name)
-            old_filepath = component.rename(new_name)
+            old_filepath = self.component_manager.rename_component(component, new_name)
             
             # Update the listbox
             self.listbox.delete(selected_idx)
@@ -230,8 +230,10 @@ class ComponentListFrame(ttk.LabelFrame):
             self.app.log(f"Renamed component from {os.path.basename(old_filepath)} to {component.name}")
             self.app.set_status(f"Renamed: {component.name}")
             
-            # Ask if user wants to delete the old file if it's different
-            if old_filepath != component.filepath:
+            # Ask if user wants to delete the old file if it's different; a
+            # rename that only changed case leaves no separate file behind
+            if (old_filepath != component.filepath and os.path.exists(old_filepath)
+                    and not os.path.samefile(old_filepath, component.filepath)):
                 if messagebox.askyesno("Delete Old File", 
                                    f"Delete the original file {os.path.basename(old_filepath)}?"):
                     try:
@@ -270,7 +272,7 @@ class ComponentListFrame(ttk.LabelFrame):
             new_component = component.duplicate(new_name)
             
             # Add to component manager
-            self.component_manager.components.append(new_component)
+            self.component_manager.add_component_instance(new_component)
             
             # Add to listbox
             self.listbox.insert(tk.END, new_component.display_name)
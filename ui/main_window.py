@@ -695,7 +695,7 @@ class TSXComponentManager:
         progress_callback("Scanning components for dependencies...")
         all_dependencies = set()
         for component in components:
-            deps = component.get_dependencies()
+            deps = component.dependencies()
             all_dependencies.update(deps)
         
         # Add all components to the components directory
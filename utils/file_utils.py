@@ -2,12 +2,22 @@
 File utility functions for TSX Component Manager
 """
 import os
+import json
 import shutil
 import logging
-from typing import List, Optional, Dict, Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional, Dict, Any, Callable, Iterable, Sequence, Tuple
+
+try:
+    import orjson
+except ImportError:  # optional; stdlib json is used when it is not installed
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on threads used to write generated files
+MAX_WRITE_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
 def ensure_directory(directory: str) -> bool:
     """
     Ensure a directory exists, creating it if necessary
@@ -77,4 +87,115 @@ def read_text_file(filepath: str) -> Optional[str]:
             return f.read()
     except Exception as e:
         logger.error(f"Error reading file {filepath}: {e}")
-        return None
\ No newline at end of file
+        return None
+
+def write_chunks(filepath: str, chunks: Sequence[bytes]) -> None:
+    """
+    Write pre-encoded chunks to a file with raw os calls, bypassing the file object layer
+    
+    The chunks are gathered with a single writev where the platform has it.
+    
+    Args:
+        filepath: Path to write to
+        chunks: Encoded pieces of the file, in order
+    """
+    fd = os.open(filepath, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0), 0o644)
+    try:
+        if hasattr(os, 'writev'):
+            written = os.writev(fd, chunks)
+            if written == sum(map(len, chunks)):
+                return
+            view = memoryview(b''.join(chunks))[written:]
+        else:
+            view = memoryview(b''.join(chunks))
+        
+        # Finish a short write (or the non-writev path) with plain writes
+        while view:
+            written = os.write(fd, view)
+            view = view[written:]
+    finally:
+        os.close(fd)
+
+def write_bytes(filepath: str, data: bytes) -> None:
+    """
+    Write an already encoded payload to a file
+    
+    Args:
+        filepath: Path to write to
+        data: File content
+    """
+    write_chunks(filepath, (data,))
+
+def write_atomic(filepath: str, data: bytes, preserve_mode: bool = False) -> None:
+    """
+    Write a file so readers never observe it partially written
+    
+    The data goes to a temporary sibling first and is then moved over the
+    destination with os.replace, so an interruption leaves either the
+    previous file or the complete new one.
+    
+    Args:
+        filepath: Path to write to
+        data: File content
+        preserve_mode: Keep the permission bits of the file being replaced
+    """
+    tmp_path = filepath + '.tmp'
+    try:
+        write_bytes(tmp_path, data)
+        if preserve_mode and os.path.exists(filepath):
+            shutil.copymode(filepath, tmp_path)
+        os.replace(tmp_path, filepath)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+def run_parallel(func: Callable[..., Any], items: Iterable[Tuple[Any, ...]]) -> None:
+    """
+    Call func(*item) for every item, fanning out over a thread pool when there are several
+    
+    Meant for independent file writes: os.write releases the GIL, so the
+    files are written concurrently.
+    
+    Args:
+        func: Function to call
+        items: Argument tuples, one per call
+    """
+    items = list(items)
+    if len(items) < 2:
+        for item in items:
+            func(*item)
+        return
+    
+    with ThreadPoolExecutor(max_workers=min(MAX_WRITE_WORKERS, len(items))) as executor:
+        list(executor.map(lambda item: func(*item), items))
+
+def load_json(data: bytes) -> Any:
+    """
+    Parse JSON bytes, using orjson when available
+    
+    Args:
+        data: Encoded JSON document
+        
+    Returns:
+        The parsed object
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def dump_json(obj: Any) -> bytes:
+    """
+    Serialize to 2-space indented JSON bytes, using orjson when available
+    
+    Args:
+        obj: Object to serialize
+        
+    Returns:
+        The encoded JSON document
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode('utf-8')